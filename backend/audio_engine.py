@@ -31,7 +31,9 @@ if os.name == 'nt':
     _SUBPROCESS_FLAGS['creationflags'] = subprocess.CREATE_NO_WINDOW
 
 # Add parent directory to path for config import
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 import pygame
 from config import (
@@ -30,7 +30,9 @@ from typing import Callable, Optional, Dict, List, Any
 from .loop_detector import LoopDetector
 
 # Add parent directory to path for config import
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     DATA_DIR, LOOP_DATA_FILE,
@@ -40,6 +42,7 @@ from config import (
     FADE_EXIT_DURATION_MS,
     LOOP_CROSSFADE_MS, LOOP_SWITCH_EARLY_MS, FADE_EXIT_DURATION_MS
 )
+from utils.formatting import format_time, format_duration_badge
 from .audio_engine import AudioEngine
 
 logger = logging.getLogger("LoopStation.StateManager")
@@ -49,6 +52,11 @@ class SkipRegion:
     """
     A defined section of the song to skip over during playback.
     """
+    __slots__ = (
+        'id', 'start', 'end', 'name', 'active', 'method', 'fade_ms',
+        '_label_key', '_time_label',
+    )
+
     def __init__(self, start, end, name="Skip", method="cut"):
         self.id = str(uuid.uuid4())
         self.start = start
@@ -57,6 +65,17 @@ class SkipRegion:
         self.active = True
         self.method = method # "cut" (instant) or "fade" (dip volume)
         self.fade_ms = 500   # Only used if method="fade"
+        self._label_key = None
+        self._time_label = ""
+
+    @property
+    def time_label(self):
+        """'M:SS.ss → M:SS.ss' range string, reformatted only after start/end change."""
+        key = (self.start, self.end)
+        if key != self._label_key:
+            self._label_key = key
+            self._time_label = f"{format_time(self.start)} → {format_time(self.end)}"
+        return self._time_label
 
     def to_dict(self):
         return {
@@ -96,6 +115,13 @@ class LoopRegion:
         end: End time in seconds
         active: Whether this loop will trigger during playback
     """
+    __slots__ = (
+        'id', 'start', 'end', 'name', 'active',
+        'entry_fade_ms', 'crossfade_ms', 'early_switch_ms', 'exit_fade_ms',
+        'tag_notes',
+        '_label_key', '_time_label', '_duration_label',
+    )
+
     def __init__(self, start, end, name=None):
         self.id = str(uuid.uuid4())
         self.start = start
@@ -119,12 +145,37 @@ class LoopRegion:
         # Maps tag name -> notes text for that tag
         # e.g. {"Director": "Cross SL after dialogue", "Lighting": "Fade to blue"}
         self.tag_notes = {}
+        
+        # Display strings, cached until start/end change
+        self._label_key = None
+        self._time_label = ""
+        self._duration_label = ""
 
     @property
     def tags(self):
         """Convenience: list of active tags."""
         return list(self.tag_notes.keys())
 
+    def _refresh_labels(self):
+        """Reformat the cached display strings if start/end moved."""
+        key = (self.start, self.end)
+        if key != self._label_key:
+            self._label_key = key
+            self._time_label = f"{format_time(self.start)} → {format_time(self.end)}"
+            self._duration_label = format_duration_badge(round(self.end - self.start, 1))
+
+    @property
+    def time_label(self):
+        """'M:SS.ss → M:SS.ss' range string for list views."""
+        self._refresh_labels()
+        return self._time_label
+
+    @property
+    def duration_label(self):
+        """'(N.Ns)' duration badge for list views."""
+        self._refresh_labels()
+        return self._duration_label
+
     def to_dict(self):
         """Serialize for JSON storage."""
         return {
@@ -180,18 +231,30 @@ class Marker:
         color: Optional color for display (hex string)
         tag_notes: Dict mapping tag names to their notes text
     """
+    __slots__ = ('id', 'name', 'time', 'color', 'tag_notes', '_label_key', '_time_label')
+
     def __init__(self, time_pos, name=None, color=None):
         self.id = str(uuid.uuid4())
         self.name = name or DEFAULT_MARKER_NAME
         self.time = time_pos
         self.color = color  # None = use default COLOR_MARKER
         self.tag_notes = {}  # {"Director": "notes...", "Tech": "notes..."}
+        self._label_key = None
+        self._time_label = ""
     
     @property
     def tags(self):
         """Convenience: list of active tags."""
         return list(self.tag_notes.keys())
 
+    @property
+    def time_label(self):
+        """'M:SS.ss' string, reformatted only after the marker moves."""
+        if self.time != self._label_key:
+            self._label_key = self.time
+            self._time_label = format_time(self.time)
+        return self._time_label
+
     def to_dict(self):
         """Serialize for JSON storage."""
         return {
@@ -323,6 +386,10 @@ class StateManager:
         }
         self.skips: List[SkipRegion] = []
         self._last_skip_time = 0.0
+        
+        # Immutable snapshot of self.skips for the monitor thread, swapped
+        # whole on every mutation so it never iterates a list being edited
+        self._skip_snapshot = ()
 
 
         # Load saved data
@@ -445,6 +512,7 @@ class StateManager:
             if 'skips' in saved:
                 for skip_data in saved['skips']:
                     self.skips.append(SkipRegion.from_dict(skip_data))
+            self._refresh_skip_snapshot()
             logger.info(f"Loaded {len(self.loops)} vamps, {len(self.markers)} markers, {len(self.skips)} skips")
         
         # Old format: just 'start' and 'end'
@@ -879,12 +947,14 @@ class StateManager:
         self.skips.append(new_skip)
         # Keep sorted by start time
         self.skips.sort(key=lambda x: x.start)
+        self._refresh_skip_snapshot()
         self.save_loop()
         self._emit('skips_changed', self.skips)
         return new_skip
 
     def delete_skip(self, skip_id):
         self.skips = [s for s in self.skips if s.id != skip_id]
+        self._refresh_skip_snapshot()
         self.save_loop()
         self._emit('skips_changed', self.skips)
 
@@ -892,10 +962,32 @@ class StateManager:
         for s in self.skips:
             if s.id == skip_id:
                 s.active = not s.active
+                self._refresh_skip_snapshot()
                 self.save_loop()
                 self._emit('skips_changed', self.skips)
                 break
 
+    def jump_to_skip(self, skip_id):
+        """Seek to a skip region's start and start playing."""
+        for skip in self.skips:
+            if skip.id == skip_id:
+                logger.info(f"Jumping to cut '{skip.name}' at {skip.start:.3f}s")
+                self.play_from(skip.start)
+                return True
+        return False
+
+    def _refresh_skip_snapshot(self) -> None:
+        """Resync the monitor's skip snapshot after any mutation of self.skips."""
+        self._skip_snapshot = tuple(self.skips)
+
+    def _find_active_skip(self, pos: float) -> Optional[SkipRegion]:
+        """Return the first active skip region containing pos, if any."""
+        # A song has a handful of skips, so a plain scan beats any index
+        for skip in self._skip_snapshot:
+            if skip.active and skip.start <= pos < skip.end:
+                return skip
+        return None
+
     def run_smart_cut_detection(self, start_time, end_time):
         """Run analysis to find beat-aligned cuts."""
         if self.audio.raw_audio_data is None: return
@@ -1000,22 +1092,18 @@ class StateManager:
                     # --- NEW: SKIP LOGIC ---
                     # Check cooldown to prevent skip loops (2 seconds buffer)
                     if now - self._last_skip_time > 2.0:
-                        for skip in self.skips:
-                            if not skip.active: 
-                                continue
-                                
-                            # If we are INSIDE a skip region
-                            if skip.start <= pos < skip.end:
-                                logger.info(f"Entered Skip Region '{skip.name}' ({skip.start:.2f}-{skip.end:.2f})")
-                                
-                                # Execute Jump
-                                fade_ms = skip.fade_ms if skip.method == "fade" else 0
-                                self.audio.perform_skip(skip.end, fade_out_ms=fade_ms)
-                                
-                                # Update internal state so we don't glitch UI
-                                self.audio.transport_offset = skip.end
-                                self._last_skip_time = now
-                                break
+                        # If we are INSIDE a skip region
+                        skip = self._find_active_skip(pos)
+                        if skip is not None:
+                            logger.info(f"Entered Skip Region '{skip.name}' ({skip.start:.2f}-{skip.end:.2f})")
+                            
+                            # Execute Jump
+                            fade_ms = skip.fade_ms if skip.method == "fade" else 0
+                            self.audio.perform_skip(skip.end, fade_out_ms=fade_ms)
+                            
+                            # Update internal state so we don't glitch UI
+                            self.audio.transport_offset = skip.end
+                            self._last_skip_time = now
 
                     # Emit position updates
                     if now - last_update > UI_UPDATE_INTERVAL:
@@ -35,7 +35,9 @@ except ImportError:
     HAS_QRCODE = False
 
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from config import TAG_COLORS, AVAILABLE_TAGS
 
 
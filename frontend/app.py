@@ -22,7 +22,9 @@ import threading
 import tkinter as tk
 import customtkinter as ctk
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT,
@@ -125,7 +127,9 @@ class LoopStationApp(ctk.CTk):
         self.msg_queue = queue.Queue()
 
         # --- FIX: WINDOWS TASKBAR ICON ---
-        self._pending_cue_refresh = False
+        # Fused UI refresh: dirty flags + one pending after() job
+        self._ui_dirty = set()
+        self._ui_refresh_job = None
         
         # 1. Separate this app from the generic "Python" taskbar group
         try:
@@ -166,6 +170,14 @@ class LoopStationApp(ctk.CTk):
         # 1. Start with NO audio engine (Instant load)
         self.app_state = None 
         
+        # Selected loop object, refreshed on every loops_changed and
+        # loop_points_changed event so per-tick handlers don't have to
+        # re-index app_state.loops
+        self._selected_loop = None
+        
+        # Vamp settings modal, built on first open and reused afterwards
+        self._vamp_modal = None
+        
         self._create_layout()
         self._create_widgets()
         
@@ -216,7 +228,7 @@ class LoopStationApp(ctk.CTk):
                 elif msg_type == 'detection_complete':
                     self.detector.show_results(*args)
                 elif msg_type == 'skips_changed':
-                    self._update_skips_ui(*args)
+                    self._on_skips_changed(*args)
                 elif msg_type == 'cut_detection_complete':
                     self.detector.show_results(*args)
                 elif msg_type == 'loop_skip_queued':
@@ -474,7 +486,8 @@ class LoopStationApp(ctk.CTk):
             on_rename_vamp=self._on_rename_vamp,
             on_delete_vamp=self._on_delete_vamp,
             on_toggle_skip=self._on_toggle_skip, # NEW
-            on_delete_skip=self._on_delete_skip
+            on_delete_skip=self._on_delete_skip,
+            on_jump_to_skip=self._on_jump_to_skip
         )
         self.cue_sheet.pack(fill="x")
 
@@ -696,6 +709,7 @@ class LoopStationApp(ctk.CTk):
         else:
             self.paned_window.add(self.right_sidebar_frame, minsize=250, width=RIGHT_SIDEBAR_WIDTH)
             self.right_sidebar_visible = True
+        self.notes_sidebar.set_visible(self.right_sidebar_visible)
     
     def _on_item_tag_note_change(self, item_id, tag, note_text):
         """Handle tag note save from the sidebar."""
@@ -1206,12 +1220,22 @@ class LoopStationApp(ctk.CTk):
 
     def _update_loop_points(self, loop_in, loop_out):
         """Update waveform display with new loop points."""
+        # set_loop_in/set_loop_out can create the first loop while emitting
+        # only loop_points_changed, so refresh the cached selection here too
+        loops = self.app_state.loops
+        idx = self.app_state.selected_loop_index
+        self._selected_loop = loops[idx] if 0 <= idx < len(loops) else None
         if self.waveform:
             self.waveform.update_loop_markers(loop_in, loop_out)
         # REMOVED: self.loop_controls.set_loop_points(loop_in, loop_out)
 
     def _handle_loops_changed(self, loops, selected_index):
         """Update UI when loops change."""
+        if 0 <= selected_index < len(loops):
+            self._selected_loop = loops[selected_index]
+        else:
+            self._selected_loop = None
+        
         if self.waveform:
             self.waveform.update_loops_display(loops, selected_index)
         self._refresh_cue_sheet()
@@ -1442,8 +1466,14 @@ class LoopStationApp(ctk.CTk):
         
         self.app_state.select_loop(loop_idx)
         current_loop = self.app_state.loops[loop_idx]
+        # Sliders may move before the queued loops_changed is handled
+        self._selected_loop = current_loop
+        
+        if self._vamp_modal is not None and self._vamp_modal.winfo_exists():
+            self._vamp_modal.rebind(current_loop)
+            return
         
-        modal = VampModal(
+        self._vamp_modal = VampModal(
             parent=self,
             loop=current_loop,
             state_manager=self.app_state,
@@ -1452,10 +1482,10 @@ class LoopStationApp(ctk.CTk):
 
     def _on_vamp_setting_change(self, key, value):
         """Callback when a slider moves."""
-        if self.app_state is None or self.app_state.selected_loop_index < 0:
+        loop = self._selected_loop
+        if self.app_state is None or loop is None:
             return
-            
-        loop = self.app_state.loops[self.app_state.selected_loop_index]
+        
         setattr(loop, key, value)
         
         if key == "crossfade_ms":
@@ -1468,25 +1498,50 @@ class LoopStationApp(ctk.CTk):
     # =========================================================================
 
     def _on_skips_changed(self, skips):
-        """Backend updated the list of skips."""
+        """Backend updated the list of skips.
+        
+        Bursts of events (multi-delete, rapid toggles) collapse into the
+        next fused refresh, which reads the latest skips from app_state.
+        """
         self._update_skips_ui(skips)
 
     def _update_skips_ui(self, skips):
-        if self.waveform:
-            self.waveform.update_skips_display(skips)
-        self._refresh_cue_sheet()
+        self._schedule_ui_refresh(skips=True, cue=True)
 
     def _refresh_cue_sheet(self):
         """Schedule an update to the cue sheet rather than doing it instantly."""
+        self._schedule_ui_refresh(cue=True)
+
+    def _schedule_ui_refresh(self, skips=False, cue=False):
+        """
+        Mark parts of the UI dirty and schedule one fused refresh.
+        
+        Every caller inside the 50ms window shares a single pass, so a skips
+        change repaints the waveform overlay and the cue sheet together.
+        """
         # Use getattr to prevent crashes if this is called before __init__ finishes
-        if not getattr(self, '_pending_cue_refresh', False):
-            self._pending_cue_refresh = True
-            self.after(50, self._execute_cue_refresh)
+        dirty = getattr(self, '_ui_dirty', None)
+        if dirty is None:
+            return
+        if skips:
+            dirty.add('skips')
+        if cue:
+            dirty.add('cue')
+        if dirty and self._ui_refresh_job is None:
+            self._ui_refresh_job = self.after(50, self._do_ui_refresh)
+
+    def _do_ui_refresh(self):
+        """Run each pending UI update exactly once."""
+        self._ui_refresh_job = None
+        dirty, self._ui_dirty = self._ui_dirty, set()
+        
+        if 'skips' in dirty and self.waveform and self.app_state is not None:
+            self.waveform.update_skips_display(self.app_state.skips)
+        if 'cue' in dirty:
+            self._execute_cue_refresh()
 
     def _execute_cue_refresh(self):
         """Perform the actual destruction and recreation of widgets once."""
-        self._pending_cue_refresh = False
-        
         # Ensure app_state actually exists before trying to read from it
         if getattr(self, 'app_state', None) is not None:
             self.cue_sheet.update_data(
@@ -1502,6 +1557,9 @@ class LoopStationApp(ctk.CTk):
     def _on_delete_skip(self, skip_id):
         self.app_state.delete_skip(skip_id)
 
+    def _on_jump_to_skip(self, skip_id):
+        self.app_state.jump_to_skip(skip_id)
+
 
 
 
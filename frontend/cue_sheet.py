@@ -10,17 +10,27 @@ REDESIGNED: Includes inline action buttons for vamps:
 - ⚙️ Open settings modal
 - ✏ Rename
 - ✕ Delete
+
+The list is virtualized: only rows intersecting the visible viewport
+exist as widgets. Rows are pooled per item type and re-bound to new
+items as the list scrolls, instead of one CTkFrame per item.
 """
 
 import logging
 import tkinter as tk
+import tkinter.font as tkfont
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, partial
 from typing import Callable, Optional, List
 
 import customtkinter as ctk
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BTN_PRIMARY, COLOR_BTN_DANGER, COLOR_BTN_SUCCESS,
@@ -29,10 +39,83 @@ from config import (
     PADDING_SMALL, PADDING_MEDIUM, COLOR_BTN_TEXT,
     COLOR_SKIP_REGION, COLOR_SKIP_CANDIDATE
 )
-from utils.tooltip import ToolTip
+from utils.tooltip import ToolTip, SharedToolTip
+from .input_dialog import AsyncInputDialog
+from .virtual_list import VirtualList
 
 logger = logging.getLogger("LoopStation.CueSheet")
 
+# Virtualized list geometry. Row i is placed at y = i * ROW_H (unscaled
+# pixels): ROW_INNER_H for the frame plus ROW_PAD above and below, so the
+# visible window can be computed from the scroll offset alone.
+ROW_INNER_H = 30
+ROW_PAD = 1
+ROW_H = ROW_INNER_H + 2 * ROW_PAD
+
+# Static row cells are drawn on one canvas per row (see _cell_canvas). It is
+# shorter than the row so a 2px highlight border stays visible around it.
+# Widths and x offsets reproduce the former per-cell label layout.
+CELL_H = ROW_INNER_H - 4
+MARKER_CELLS_W = 91       # icon + time
+MARKER_INDICATOR_W = 20   # current ▶, only while the cue is current
+VAMP_CELLS_W = 215        # icon + time range + duration badge
+SKIP_NAME_X = 172         # left edge of the skip name area
+
+# Extra rows rendered above/below the viewport so small scrolls and
+# scaling round-off never expose an empty gap
+OVERSCAN_ROWS = 2
+
+# Playhead moves smaller than this (seconds) don't re-run highlighting
+POSITION_EPSILON = 0.02
+
+
+# Fonts are shared objects rather than tuples re-parsed by every widget.
+# They need a Tk root, so each is built lazily on first use and cached.
+
+@lru_cache(maxsize=64)
+def _scaled_font(font, scaling):
+    """Shared tkfont.Font for a CTk-style (family, size, *style) tuple, scaled to pixels."""
+    family, size, *style = font
+    return tkfont.Font(
+        family=family, size=-round(size * scaling),
+        weight="bold" if "bold" in style else "normal",
+        slant="italic" if "italic" in style else "roman"
+    )
+
+
+@lru_cache(maxsize=None)
+def _name_font(bold):
+    """Shared CTkFont for row name buttons (CTk scales it itself)."""
+    return ctk.CTkFont(family="Segoe UI", size=11, weight="bold" if bold else "normal")
+
+
+class _RowPool:
+    """
+    Free lists of row frames, one per item type.
+
+    Rows are built once by the panel's template factories and recycled as
+    the visible window moves, so scrolling doesn't construct widgets once
+    the pool is warm.
+    """
+
+    def __init__(self, factories):
+        self._factories = factories  # item_type -> callable returning a new row
+        self._free = {item_type: [] for item_type in factories}
+
+    def acquire(self, item_type):
+        """Return an unused row for item_type, building one if the pool is empty."""
+        free = self._free[item_type]
+        if free:
+            return free.pop()
+        row = self._factories[item_type]()
+        row.item_type = item_type
+        row.style = ("transparent", 0, None)  # As built by the template factories
+        return row
+
+    def release(self, row):
+        """Return a row hidden by the virtual list to its free list."""
+        self._free[row.item_type].append(row)
+
 
 class CueSheetPanel(ctk.CTkFrame):
     """
@@ -58,6 +141,7 @@ class CueSheetPanel(ctk.CTkFrame):
         on_delete_vamp: Optional[Callable[[int], None]] = None,
         on_toggle_skip=None,
         on_delete_skip=None,
+        on_jump_to_skip: Optional[Callable[[str], None]] = None,
         **kwargs
     ):
         super().__init__(parent, fg_color="transparent", **kwargs)
@@ -81,13 +165,43 @@ class CueSheetPanel(ctk.CTkFrame):
         # State
         self._markers = []
         self._loops = []
+        self._skips = []
         self._selected_loop_index = -1
-        self._item_widgets = []
+        self._sorted_items = []   # (sort_time, item_type, data, ref_id), time-ordered
+        self._timeline_times = []  # sort_time column of _sorted_items, for prev/next
         self._item_metadata = []  # (item_type, data, ref_id) per row
         self._current_position = 0.0
-        
+        self._last_current_items = set()
+        self._data_version = 0
+        self._pending_data = None
+        self._rebuild_after = None
+        self._last_content_sig = None
+        self._pending_after = None
+        self._last_applied_position = float('-inf')
+
+        # Highlight lookup tables, rebuilt by _build_highlight_index()
+        self._marker_times = []
+        self._marker_next_boundary = []
+        self._marker_row_idx = []
+        self._interval_starts = []
+        self._interval_ends = []
+        self._interval_idx = []
+        self._interval_max_end = []
+        self._highlight_cache = None
+
+        # Virtualized rendering (see VirtualList), rows pooled per item type
+        self._rows = None
+        self._empty_shown = False
+        self._rename_dialog = None
+        self._pool = _RowPool({
+            'marker': self._create_marker_row,
+            'vamp': self._create_vamp_row,
+            'skip': self._create_skip_row,
+        })
+
         self.on_toggle_skip = on_toggle_skip
         self.on_delete_skip = on_delete_skip
+        self.on_jump_to_skip = on_jump_to_skip
 
         self._create_widgets()
     
@@ -105,7 +219,7 @@ class CueSheetPanel(ctk.CTkFrame):
             command=self._on_prev
         )
         self.btn_prev.pack(side="left", padx=(0, 3))
-        ToolTip(self.btn_prev, "Jump to previous cue or vamp  ( [ )")
+        ToolTip(self.btn_prev, "Jump to previous cue, vamp or cut  ( [ )")
         
         self.btn_next = ctk.CTkButton(
             toolbar, text="⏭", width=30, height=24,
@@ -114,7 +228,7 @@ class CueSheetPanel(ctk.CTkFrame):
             command=self._on_next
         )
         self.btn_next.pack(side="left", padx=(0, 10))
-        ToolTip(self.btn_next, "Jump to next cue or vamp  ( ] )")
+        ToolTip(self.btn_next, "Jump to next cue, vamp or cut  ( ] )")
         
         # Add Cue button
         self.btn_add_cue = ctk.CTkButton(
@@ -161,17 +275,136 @@ class CueSheetPanel(ctk.CTkFrame):
             scrollbar_button_color=COLOR_BG_LIGHT
         )
         self.item_list.pack(fill="x")
-    
+
+        # Empty-state hint, built once and shown/hidden by _rebuild_list
+        self._empty_label = ctk.CTkLabel(
+            self.item_list,
+            text="No cues, vamps, or cuts yet. Press M to add a cue point, or use + buttons above.",
+            text_color=COLOR_TEXT_DIM, font=("Segoe UI", 10),
+            wraplength=400
+        )
+
+        # Row buttons share one tooltip window and pointer tracker instead
+        # of binding a ToolTip on every pooled button
+        self._row_tips = SharedToolTip(self.item_list)
+
+        # Only the rows in view exist. Rows are keyed by item, so after a
+        # rebuild each surviving item gets its own row back.
+        self._rows = VirtualList(
+            self.item_list, ROW_H, ROW_PAD,
+            acquire=self._acquire_item_row,
+            bind=self._bind_item_row,
+            release=self._pool.release,
+            key=self._item_key_at,
+            overscan=OVERSCAN_ROWS,
+            bg=COLOR_BG_MEDIUM,
+        )
+
+    def destroy(self):
+        """Cancel a pending rebuild or highlight update before tearing down.
+
+        The window render is cancelled by VirtualList; pooled rows are
+        children of the list and are destroyed with it.
+        """
+        for attr in ('_rebuild_after', '_pending_after'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                try:
+                    self.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+                setattr(self, attr, None)
+        super().destroy()
+
     def update_data(self, markers, loops, selected_loop_index, skips=None):
         """
         Update the cue sheet with current markers and loops.
         Merges both into a single time-sorted list and rebuilds the UI.
+
+        The rebuild runs at idle time; a burst of calls (e.g. auto-detect
+        adding several vamps) only rebuilds once, from the latest data.
         """
+        self._pending_data = (markers, loops, selected_loop_index, skips)
+        self._data_version += 1
+        if self._rebuild_after is not None:
+            return
+        self._rebuild_after = self.after_idle(self._flush_rebuild)
+
+    def _flush_rebuild(self):
+        """Apply the latest update_data() payload and rebuild once."""
+        self._rebuild_after = None
+        markers, loops, selected_loop_index, skips = self._pending_data
+        self._pending_data = None
         self._markers = markers or []
         self._loops = loops or []
         self._skips = skips or [] # Store skips
+
+        # Most updates only move the vamp selection. If the item content is
+        # unchanged, restyle the affected rows instead of rebuilding.
+        content_sig = self._content_signature()
+        if content_sig == self._last_content_sig:
+            self._update_selection(selected_loop_index)
+            return
+        self._last_content_sig = content_sig
+
         self._selected_loop_index = selected_loop_index
+        self._recompute_timeline()
         self._rebuild_list()
+
+    def _content_signature(self):
+        """Value snapshot of everything the sorted item list is built from."""
+        return (
+            tuple((m.id, m.time, m.name) for m in self._markers),
+            tuple((l.id, l.start, l.end, l.name) for l in self._loops),
+            tuple((s.id, s.start, s.end, s.name, s.active) for s in self._skips),
+        )
+
+    def _update_selection(self, selected_loop_index):
+        """Move the vamp selection highlight without rebuilding the list."""
+        old_index = self._selected_loop_index
+        if selected_loop_index == old_index:
+            return
+        self._selected_loop_index = selected_loop_index
+
+        current = self._last_current_items
+        for idx, row in self._rows.rows.items():
+            if row.item_type == 'vamp' and row.ref_id in (old_index, selected_loop_index):
+                is_current = idx in current
+                self._refresh_row(row, 'vamp', row.data, row.ref_id, is_current)
+                row.sig = (row.key, self._row_signature('vamp', row.data, row.ref_id, is_current))
+
+    def _recompute_timeline(self):
+        """
+        Build the unified time-sorted item list and everything derived from it.
+
+        Runs once per update_data; _rebuild_list, highlighting and prev/next
+        navigation all read these instead of re-sorting their own copies.
+        """
+        # Build unified list of (sort_time, type, data, ref_id)
+        # ref_id is loop_index for vamps, or object.id for skips
+        items = []
+
+        # Add Markers
+        for marker in self._markers:
+            items.append((marker.time, 'marker', marker, None))
+
+        # Add Vamps (Loops)
+        for i, loop in enumerate(self._loops):
+            items.append((loop.start, 'vamp', loop, i))
+
+        # Add Skips (Cuts) - NEW
+        for skip in self._skips:
+            items.append((skip.start, 'skip', skip, skip.id))
+
+        # Sort by time
+        items.sort(key=lambda x: x[0])
+
+        self._sorted_items = items
+        self._item_metadata = [(item_type, data, ref_id) for _, item_type, data, ref_id in items]
+        self._build_highlight_index(items)
+
+        # Prev/next navigation walks every item: cues, vamps and cuts
+        self._timeline_times = array('d', [t for t, *_ in items])
     
     def update_position(self, position):
         """Update current playback position for highlighting.
@@ -179,11 +412,23 @@ class CueSheetPanel(ctk.CTkFrame):
         PERFORMANCE FIX: Instead of destroying and recreating ALL widgets
         (which causes missed clicks because buttons get destroyed mid-click),
         we only update the visual styling when the highlighted set changes.
+
+        Calls are coalesced: the highlight is recomputed at most once per Tk
+        idle cycle, using the latest position, and sub-frame moves are dropped.
         """
         self._current_position = position
+        if abs(position - self._last_applied_position) < POSITION_EPSILON:
+            return
+        if self._pending_after is None:
+            self._pending_after = self.after_idle(self._apply_pending_position)
+
+    def _apply_pending_position(self):
+        """Apply the latest playhead position to the row highlighting."""
+        self._pending_after = None
+        self._last_applied_position = self._current_position
         new_current = self._get_current_item_index()
-        if not hasattr(self, '_last_current_items') or self._last_current_items != new_current:
-            old_current = getattr(self, '_last_current_items', set())
+        if self._last_current_items != new_current:
+            old_current = self._last_current_items
             self._last_current_items = new_current
             
             # Update highlight in-place instead of full rebuild
@@ -192,95 +437,198 @@ class CueSheetPanel(ctk.CTkFrame):
     def _update_highlight(self, old_idx, new_idx):
         """Update just the highlight styling in-place without rebuilding widgets.
         
-        Only touches rows whose highlight state actually changed,
-        preventing the flash/flicker caused by destroy-and-recreate.
+        Only touches rendered rows whose highlight state actually changed;
+        off-screen items pick up their state when they scroll into view.
         """
         changed = old_idx.symmetric_difference(new_idx)
-        
+
         for idx in changed:
-            if idx >= len(self._item_widgets) or idx >= len(self._item_metadata):
+            if idx >= len(self._item_metadata):
                 # Safety: if indices are out of range, do a full rebuild once
                 self._rebuild_list()
                 return
-            
-            row = self._item_widgets[idx]
+
+            row = self._rows.rows.get(idx)
+            if row is None:
+                continue
             item_type, data, ref_id = self._item_metadata[idx]
             is_current = idx in new_idx
-            
+
             try:
-                if item_type == 'marker':
-                    if is_current:
-                        row.configure(fg_color="#3a3a1a", border_width=2, border_color=COLOR_MARKER)
-                    else:
-                        row.configure(fg_color="transparent", border_width=0)
-                        
-                elif item_type == 'vamp':
-                    is_selected = (ref_id == self._selected_loop_index)
-                    if is_selected and is_current:
-                        row.configure(fg_color="#2a4a2a", border_width=2, border_color="#66ff66")
-                    elif is_selected:
-                        row.configure(fg_color="#1a331a", border_width=1, border_color=COLOR_LOOP_REGION)
-                    elif is_current:
-                        row.configure(fg_color="#2a2a1a", border_width=2, border_color="#ffff00")
-                    else:
-                        row.configure(fg_color="transparent", border_width=0)
-                        
-                elif item_type == 'skip':
-                    if is_current:
-                        row.configure(border_width=1, border_color=COLOR_SKIP_REGION)
-                    else:
-                        row.configure(border_width=0)
+                self._apply_row_style(row, self._row_style(item_type, data, ref_id, is_current))
+                row.sig = None  # Partially restyled; force a full refresh on next bind
             except Exception:
                 # Widget was destroyed or invalid — fall back to full rebuild
                 self._rebuild_list()
                 return
 
-    def _create_skip_row(self, skip, is_current=False):
-        """Create a row for a Skip Region (Cut)."""
-        # We use a dark background if active, or transparent if inactive.
-        # Ideally, we would use a theme variable for the bg, but for now 
-        # we will use a semi-transparent version logic or a hardcoded dark overlay 
-        # to ensure readability against the text color.
-        bg = "#331111" if skip.active else "transparent"
-        
-        border = COLOR_SKIP_REGION if is_current else None
-        
-        row = ctk.CTkFrame(self.item_list, fg_color=bg, height=30, corner_radius=4,
-                           border_width=1 if is_current else 0, border_color=border)
-        row.pack(fill="x", pady=1)
-        
-        # Icon
-        ctk.CTkLabel(row, text="✂", width=24, text_color=COLOR_SKIP_CANDIDATE).pack(side="left", padx=4)
-        
-        # Time
-        time_text = f"{self._format_time(skip.start)} → {self._format_time(skip.end)}"
-        ctk.CTkLabel(row, text=time_text, font=("Consolas", 10), 
-                     text_color=COLOR_SKIP_CANDIDATE, width=130).pack(side="left")
-                     
-        # Name
-        name_lbl = ctk.CTkLabel(row, text=skip.name, font=("Segoe UI", 11, "italic"),
-                                text_color=COLOR_SKIP_CANDIDATE if skip.active else COLOR_TEXT_DIM)
-        name_lbl.pack(side="left", padx=10, fill="x", expand=True)
-        
+    def _row_style(self, item_type, data, ref_id, is_current):
+        """Return (fg_color, border_width, border_color) for a row frame."""
+        if item_type == 'marker':
+            if is_current:
+                return "#3a3a1a", 2, COLOR_MARKER
+            return "transparent", 0, None
+
+        if item_type == 'vamp':
+            is_selected = (ref_id == self._selected_loop_index)
+            if is_selected and is_current:
+                return "#2a4a2a", 2, "#66ff66"  # Both selected and current
+            if is_selected:
+                return "#1a331a", 1, COLOR_LOOP_REGION  # Just selected
+            if is_current:
+                return "#2a2a1a", 2, "#ffff00"  # Just current (yellowish)
+            return "transparent", 0, None
+
+        # Skip: dark background while active, border while the playhead is inside
+        bg = "#331111" if data.active else "transparent"
+        if is_current:
+            return bg, 1, COLOR_SKIP_REGION
+        return bg, 0, None
+
+    def _apply_row_style(self, row, style):
+        """Configure a row frame from a _row_style() tuple.
+
+        Every CTkFrame.configure() redraws the frame's canvas, so the last
+        applied style is remembered on the row and a no-op change is skipped.
+        """
+        if row.style == style:
+            return
+        row.style = style
+        fg_color, border_width, border_color = style
+        if border_width:
+            row.configure(fg_color=fg_color, border_width=border_width, border_color=border_color)
+        else:
+            # Never pass border_color=None to configure()
+            row.configure(fg_color=fg_color, border_width=0)
+
+        # Plain tk canvases don't inherit the frame colour; repaint them to match
+        bg = COLOR_BG_MEDIUM if fg_color == "transparent" else fg_color
+        for cells in row.tk_cells:
+            cells.configure(bg=bg)
+
+    def _cell_canvas(self, row, width, cells):
+        """
+        Draw a row's non-interactive cells as text items on one tk.Canvas.
+
+        Icon, time, duration and indicator cells never need CTk's
+        rounded-corner widgets, so a whole group of them costs one widget
+        instead of one per cell. cells is a list of (attr, x, text, font,
+        fill) with x in CTk pixel units at the cell's centre; each text
+        item id is stored as row.<attr> (skipped when attr is None).
+        """
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        height = round(CELL_H * scaling)
+        canvas = tk.Canvas(
+            row, width=round(width * scaling), height=height,
+            bg=COLOR_BG_MEDIUM, bd=0, highlightthickness=0
+        )
+        for attr, x, text, font, fill in cells:
+            item = canvas.create_text(round(x * scaling), height // 2, text=text,
+                                      fill=fill, font=_scaled_font(font, scaling))
+            if attr:
+                setattr(row, attr, item)
+        row.tk_cells.append(canvas)
+        return canvas
+
+    def _create_skip_row(self):
+        """Build a pooled row for a Skip Region (Cut); bound by _refresh_skip_row."""
+        row = ctk.CTkFrame(self.item_list, fg_color="transparent", height=ROW_INNER_H,
+                           corner_radius=4, border_width=0)
+        row.tk_cells = []
+
+        # Icon, time and name, drawn on one canvas. The name is centred in
+        # whatever width the canvas gets between the time and the controls.
+        row.cells = self._cell_canvas(row, SKIP_NAME_X + 10, [
+            (None, 16, "✂", ("Segoe UI", 11), COLOR_SKIP_CANDIDATE),
+            ('time_text', 97, "", ("Consolas", 10), COLOR_SKIP_CANDIDATE),
+            ('name_text', SKIP_NAME_X, "", ("Segoe UI", 11, "italic"), COLOR_SKIP_CANDIDATE),
+        ])
+        row.cells.pack(side="left", fill="x", expand=True)
+        row.cells.bind("<Configure>", lambda e: self._center_skip_name(row, e.width))
+
         # Toggle Active Switch
-        switch = ctk.CTkSwitch(row, text="", width=40, height=20,
-                               progress_color=COLOR_SKIP_REGION, # Use theme color for the switch
-                               command=lambda s=skip.id: self.on_toggle_skip(s) if self.on_toggle_skip else None)
-        if skip.active: switch.select()
-        else: switch.deselect()
-        switch.pack(side="right", padx=5)
-        ToolTip(switch, "Enable or disable this cut region")
-        
+        row.switch = ctk.CTkSwitch(row, text="", width=40, height=20,
+                                   progress_color=COLOR_SKIP_REGION, # Use theme color for the switch
+                                   command=lambda: self.on_toggle_skip(row.data.id) if self.on_toggle_skip else None)
+        row.switch.pack(side="right", padx=5)
+        self._row_tips.register(row.switch, "Enable or disable this cut region")
+
         # Delete
-        btn_del_s = ctk.CTkButton(row, text="✕", width=25, height=20, fg_color="transparent", 
-                      hover_color="#441111", text_color=COLOR_BTN_DANGER,
-                      command=lambda s=skip.id: self.on_delete_skip(s) if self.on_delete_skip else None
-                      )
-        btn_del_s.pack(side="right", padx=2)
-        ToolTip(btn_del_s, "Delete this cut region")
-                      
+        row.btn_del = ctk.CTkButton(row, text="✕", width=25, height=20, fg_color="transparent",
+                                    hover_color="#441111", text_color=COLOR_BTN_DANGER,
+                                    command=lambda: self.on_delete_skip(row.data.id) if self.on_delete_skip else None)
+        row.btn_del.pack(side="right", padx=2)
+        self._row_tips.register(row.btn_del, "Delete this cut region")
+
         return row
 
+    def _center_skip_name(self, row, width):
+        """Keep a skip row's name centred between the time cell and the right edge."""
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        x = (SKIP_NAME_X * scaling + width - 10 * scaling) / 2
+        row.cells.coords(row.name_text, x, round(CELL_H * scaling) // 2)
+
+    def _refresh_skip_row(self, row, skip, is_current=False):
+        """Bind a pooled row to a Skip Region (Cut)."""
+        # We use a dark background if active, or transparent if inactive.
+        # Ideally, we would use a theme variable for the bg, but for now
+        # we will use a semi-transparent version logic or a hardcoded dark overlay
+        # to ensure readability against the text color.
+        self._apply_row_style(row, self._row_style('skip', skip, skip.id, is_current))
+
+        row.cells.itemconfigure(row.time_text, text=skip.time_label)
+        row.cells.itemconfigure(row.name_text, text=skip.name,
+                                fill=COLOR_SKIP_CANDIDATE if skip.active else COLOR_TEXT_DIM)
+
+        if skip.active: row.switch.select()
+        else: row.switch.deselect()
+
+    def _build_highlight_index(self, items):
+        """
+        Precompute the lookup tables _get_current_item_index bisects into.
+
+        Built once per data change so the per-tick highlight query is
+        O(log N) instead of re-sorting and scanning every item.
+        """
+        # Cues: each is current from its time until the next cue or vamp
+        # starts, so at most one cue interval contains any position
+        marker_times, marker_next, marker_rows = [], [], []
+        next_boundary = float('inf')  # Last cue/vamp: highlight from this cue onward
+        for idx in range(len(items) - 1, -1, -1):
+            sort_time, item_type = items[idx][0], items[idx][1]
+            if item_type == 'marker':
+                marker_times.append(sort_time)
+                marker_next.append(next_boundary)
+                marker_rows.append(idx)
+            if item_type in ('marker', 'vamp'):
+                next_boundary = sort_time
+        marker_times.reverse()
+        marker_next.reverse()
+        marker_rows.reverse()
+
+        # Vamps and skips: closed [start, end] intervals, sorted by start.
+        # interval_max_end[k] is the furthest end among intervals 0..k, which
+        # lets the backwards walk stop as soon as nothing earlier can reach pos.
+        interval_starts, interval_ends, interval_rows, interval_max_end = [], [], [], []
+        max_end = float('-inf')
+        for idx, (sort_time, item_type, data, ref_id) in enumerate(items):
+            if item_type in ('vamp', 'skip'):
+                max_end = max(max_end, data.end)
+                interval_starts.append(data.start)
+                interval_ends.append(data.end)
+                interval_rows.append(idx)
+                interval_max_end.append(max_end)
+
+        # Time columns are packed doubles so bisect compares in C
+        self._marker_times = array('d', marker_times)
+        self._marker_next_boundary = array('d', marker_next)
+        self._marker_row_idx = marker_rows
+        self._interval_starts = array('d', interval_starts)
+        self._interval_ends = array('d', interval_ends)
+        self._interval_idx = interval_rows
+        self._interval_max_end = array('d', interval_max_end)
+        self._highlight_cache = None
+
     def _get_current_item_index(self):
         """
         Get the set of item indices that should be highlighted.
@@ -293,330 +641,296 @@ class CueSheetPanel(ctk.CTkFrame):
         
         Returns a set of indices into the unified sorted items list.
         """
-        items = []
-        for marker in self._markers: items.append((marker.time, 'marker', marker, None))
-        for i, loop in enumerate(self._loops): items.append((loop.start, 'vamp', loop, i))
-        for skip in self._skips: items.append((skip.start, 'skip', skip, skip.id))
-        items.sort(key=lambda x: x[0])
+        pos = self._current_position
+        cache_key = (pos, self._data_version)
+        if self._highlight_cache is not None and self._highlight_cache[0] == cache_key:
+            return set(self._highlight_cache[1])
 
         highlighted = set()
-        
-        for idx, (sort_time, item_type, data, ref_id) in enumerate(items):
-            if item_type == 'marker':
-                # Cue is highlighted from its time until the next cue or vamp start
-                if self._current_position < data.time:
-                    continue  # Haven't reached this cue yet
-                
-                # Find the next cue or vamp start time after this marker
-                next_boundary = None
-                for next_idx in range(idx + 1, len(items)):
-                    next_item_type = items[next_idx][1]
-                    if next_item_type in ('marker', 'vamp'):
-                        next_boundary = items[next_idx][0]
-                        break
-                
-                if next_boundary is not None:
-                    if data.time <= self._current_position < next_boundary:
-                        highlighted.add(idx)
-                else:
-                    # Last cue/vamp in the list - highlight from this cue onward
-                    if self._current_position >= data.time:
-                        highlighted.add(idx)
-                        
-            elif item_type == 'vamp':
-                # Vamp: highlight while position is within range
-                if data.start <= self._current_position <= data.end:
-                    highlighted.add(idx)
-                    
-            elif item_type == 'skip':
-                # Skip: highlight while position is within range
-                if data.start <= self._current_position <= data.end:
-                    highlighted.add(idx)
-        
+
+        # Cue: the last cue at or before pos, if pos hasn't reached its boundary
+        i = bisect_right(self._marker_times, pos) - 1
+        if i >= 0 and pos < self._marker_next_boundary[i]:
+            highlighted.add(self._marker_row_idx[i])
+
+        # Vamps/skips: walk back from the last interval starting at or before pos
+        k = bisect_right(self._interval_starts, pos) - 1
+        while k >= 0 and self._interval_max_end[k] >= pos:
+            if pos <= self._interval_ends[k]:
+                highlighted.add(self._interval_idx[k])
+            k -= 1
+
+        self._highlight_cache = (cache_key, frozenset(highlighted))
         return highlighted
 
     def _rebuild_list(self):
-        """Rebuild the item list, sorted by time."""
-        # Clear existing widgets
-        for w in self._item_widgets:
-            w.destroy()
-        self._item_widgets.clear()
-        self._item_metadata = []  # Track (item_type, data, ref_id) per row
-
-        # Build unified list of (sort_time, type, data, ref_id)
-        # ref_id is loop_index for vamps, or object.id for skips
-        items = []
-        
-        # Add Markers
-        for marker in self._markers:
-            items.append((marker.time, 'marker', marker, None))
-            
-        # Add Vamps (Loops)
-        for i, loop in enumerate(self._loops):
-            items.append((loop.start, 'vamp', loop, i))
-            
-        # Add Skips (Cuts) - NEW
-        for skip in self._skips:
-            items.append((skip.start, 'skip', skip, skip.id))
+        """Re-render the visible window from the current time-sorted item list."""
+        # Get current items for highlighting (set of indices)
+        self._last_current_items = self._get_current_item_index()
 
-        # Sort by time
-        items.sort(key=lambda x: x[0])
+        self._show_empty_label(not self._sorted_items)
+        self._rows.reset(len(self._sorted_items))
 
-        if not items:
-            lbl = ctk.CTkLabel(
-                self.item_list,
-                text="No cues, vamps, or cuts yet. Press M to add a cue point, or use + buttons above.",
-                text_color=COLOR_TEXT_DIM, font=("Segoe UI", 10),
-                wraplength=400
-            )
-            lbl.pack(pady=8)
-            self._item_widgets.append(lbl)
+    def _show_empty_label(self, show):
+        """Toggle the persistent empty-state label."""
+        if show == self._empty_shown:
             return
+        self._empty_shown = show
+        if show:
+            self._empty_label.pack(pady=8)
+        else:
+            self._empty_label.pack_forget()
 
-        # Get current items for highlighting (set of indices)
-        current_items = self._get_current_item_index()
+    def _acquire_item_row(self, idx):
+        """Pooled row of the right type for item idx."""
+        return self._pool.acquire(self._sorted_items[idx][1])
 
-        for idx, (sort_time, item_type, data, ref_id) in enumerate(items):
-            # Check if this item should be highlighted
-            is_current = idx in current_items
-            
-            if item_type == 'marker':
-                row = self._create_marker_row(data, is_current)
-            elif item_type == 'vamp':
-                is_selected = (ref_id == self._selected_loop_index)
-                row = self._create_vamp_row(data, ref_id, is_selected, is_current)
-            elif item_type == 'skip':
-                row = self._create_skip_row(data, is_current) # NEW
-            
-            self._item_widgets.append(row)
-            self._item_metadata.append((item_type, data, ref_id))
-
-    def _format_time(self, seconds):
-        """Format seconds as M:SS.ss"""
-        minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes}:{secs:05.2f}"
-    
-    def _create_marker_row(self, marker, is_current=False):
-        """Create a row widget for a cue point marker."""
-        # Highlight if current
-        bg = "#3a3a1a" if is_current else "transparent"
-        border_color = COLOR_MARKER if is_current else None
-        
+    def _item_key_at(self, idx):
+        """_item_key of item idx, for the virtual list's row reuse."""
+        _, item_type, data, ref_id = self._sorted_items[idx]
+        return self._item_key(item_type, data, ref_id)
+
+    def _bind_item_row(self, row, idx):
+        """
+        Point a row at item idx. A row handed back for the same item with
+        unchanged content is reused without any configure() calls.
+        """
+        _, item_type, data, ref_id = self._sorted_items[idx]
+        is_current = idx in self._last_current_items
+        key = self._item_key(item_type, data, ref_id)
+        row.key = key
+        # The row's buttons were bound once at build time and read these
+        row.data = data
+        row.ref_id = ref_id
+        sig = (key, self._row_signature(item_type, data, ref_id, is_current))
+        if getattr(row, 'sig', None) != sig:
+            self._refresh_row(row, item_type, data, ref_id, is_current)
+            row.sig = sig
+
+    @staticmethod
+    def _item_key(item_type, data, ref_id):
+        """Stable identity for an item: marker.id, loop index or skip.id."""
+        return (item_type, data.id if item_type == 'marker' else ref_id)
+
+    def _row_signature(self, item_type, data, ref_id, is_current):
+        """Everything a row's bound content depends on; equal means no refresh needed."""
+        if item_type == 'marker':
+            return (data.name, data.time_label, is_current)
+        if item_type == 'vamp':
+            return (data.name, data.time_label, data.duration_label,
+                    ref_id == self._selected_loop_index, is_current)
+        return (data.name, data.time_label, data.active, is_current)
+
+    def _refresh_row(self, row, item_type, data, ref_id, is_current):
+        """Bind a pooled row to an item, dispatching on its type."""
+        if item_type == 'marker':
+            self._refresh_marker_row(row, data, is_current)
+        elif item_type == 'vamp':
+            is_selected = (ref_id == self._selected_loop_index)
+            self._refresh_vamp_row(row, data, ref_id, is_selected, is_current)
+        elif item_type == 'skip':
+            self._refresh_skip_row(row, data, is_current)
+
+    def _create_marker_row(self):
+        """Build a pooled row for a cue point marker; bound by _refresh_marker_row."""
         row = ctk.CTkFrame(
-            self.item_list, 
-            fg_color=bg, 
-            height=28,
+            self.item_list,
+            fg_color="transparent",
+            height=ROW_INNER_H,
             corner_radius=4,
-            border_width=2 if is_current else 0,
-            border_color=COLOR_MARKER if is_current else None  # CHANGED: Don't use "transparent"
+            border_width=0
         )
-        row.pack(fill="x", pady=1)
-        row.pack_propagate(False)
-        
-        # Type icon - brighter if current
-        icon_color = "#ffff00" if is_current else COLOR_MARKER
-        ctk.CTkLabel(
-            row, text="📍", width=24,
-            font=("Segoe UI", 12)
-        ).pack(side="left", padx=(4, 2))
-        
-        # Time - brighter if current
-        time_color = "#ffff00" if is_current else COLOR_MARKER
-        ctk.CTkLabel(
-            row, text=self._format_time(marker.time),
-            font=("Consolas", 10),
-            text_color=time_color,
-            width=55
-        ).pack(side="left", padx=(0, 6))
-        
-        # Current indicator
-        if is_current:
-            ctk.CTkLabel(
-                row, text="▶",
-                font=("Segoe UI", 10),
-                text_color="#ffff00",
-                width=16
-            ).pack(side="left", padx=(0, 4))
-        
+        row.tk_cells = []
+
+        # Type icon, time and current indicator, drawn on one canvas. The
+        # indicator slot is only part of the canvas width while current.
+        row.cells = self._cell_canvas(row, MARKER_CELLS_W, [
+            (None, 16, "📍", ("Segoe UI", 12), COLOR_TEXT),
+            ('time_text', 57.5, "", ("Consolas", 10), COLOR_MARKER),
+            ('indicator_text', 99, "▶", ("Segoe UI", 10), "#ffff00"),
+        ])
+        row.cells.pack(side="left")
+
         # Name (clickable to jump)
-        name_btn = ctk.CTkButton(
+        row.name_btn = ctk.CTkButton(
             row,
-            text=marker.name,
+            text="",
             anchor="w",
             height=22,
-            font=("Segoe UI", 11, "bold" if is_current else "normal"),
+            font=_name_font(False),
             fg_color="transparent",
             hover_color=COLOR_BG_LIGHT,
-            text_color="#ffffff" if is_current else COLOR_TEXT,
-            command=lambda mid=marker.id: self._on_jump_marker(mid)
+            command=lambda: self._on_jump_marker(row.data.id)
         )
-        name_btn.pack(side="left", fill="x", expand=True, padx=2)
-        
+        row.name_btn.pack(side="left", fill="x", expand=True, padx=2)
+
         # Rename
-        btn_ren_m = ctk.CTkButton(
+        row.btn_ren = ctk.CTkButton(
             row, text="✏", width=24, height=20,
             fg_color="transparent", hover_color=COLOR_BG_LIGHT,
             text_color=COLOR_TEXT_DIM,
-            command=lambda mid=marker.id, mn=marker.name: self._on_rename_marker(mid, mn)
+            command=lambda: self._on_rename_marker(row.data.id, row.data.name)
         )
-        btn_ren_m.pack(side="right", padx=1)
-        ToolTip(btn_ren_m, "Rename this cue")
-        
+        row.btn_ren.pack(side="right", padx=1)
+        self._row_tips.register(row.btn_ren, "Rename this cue")
+
         # Delete
-        btn_del_m = ctk.CTkButton(
+        row.btn_del = ctk.CTkButton(
             row, text="✕", width=24, height=20,
             fg_color="transparent", hover_color="#442222",
             text_color="#aa4444",
-            command=lambda mid=marker.id: self._on_delete_marker(mid)
+            command=lambda: self._on_delete_marker(row.data.id)
         )
-        btn_del_m.pack(side="right", padx=1)
-        ToolTip(btn_del_m, "Delete this cue")
-        
+        row.btn_del.pack(side="right", padx=1)
+        self._row_tips.register(row.btn_del, "Delete this cue")
+
         return row
 
-    def _create_vamp_row(self, loop, loop_idx, is_selected, is_current=False):
-        """Create a row widget for a vamp (loop region) with inline action buttons."""
-        # Highlight: selected OR current
-        if is_selected and is_current:
-            bg = "#2a4a2a"  # Both selected and current
-            border_color = "#66ff66"
-            border_width = 2
-        elif is_selected:
-            bg = "#1a331a"  # Just selected
-            border_color = COLOR_LOOP_REGION
-            border_width = 1
-        elif is_current:
-            bg = "#2a2a1a"  # Just current (yellowish)
-            border_color = "#ffff00"
-            border_width = 2
-        else:
-            bg = "transparent"
-            border_color = None  # CHANGED: None instead of "transparent"
-            border_width = 0
-        
+    def _refresh_marker_row(self, row, marker, is_current=False):
+        """Bind a pooled row to a cue point marker."""
+        # Highlight if current
+        self._apply_row_style(row, self._row_style('marker', marker, None, is_current))
+
+        # Time - brighter if current
+        row.cells.itemconfigure(
+            row.time_text,
+            text=marker.time_label,
+            fill="#ffff00" if is_current else COLOR_MARKER
+        )
+
+        # Current indicator
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        width = MARKER_CELLS_W + (MARKER_INDICATOR_W if is_current else 0)
+        row.cells.configure(width=round(width * scaling))
+        row.cells.itemconfigure(row.indicator_text, state="normal" if is_current else "hidden")
+
+        row.name_btn.configure(
+            text=marker.name,
+            font=_name_font(is_current),
+            text_color="#ffffff" if is_current else COLOR_TEXT
+        )
+
+    def _create_vamp_row(self):
+        """Build a pooled row for a vamp with inline action buttons; bound by _refresh_vamp_row."""
         row = ctk.CTkFrame(
-            self.item_list, fg_color=bg, height=30,
+            self.item_list, fg_color="transparent", height=ROW_INNER_H,
             corner_radius=4,
-            border_width=border_width,
-            border_color=border_color  # Now either a real color or None
+            border_width=0
         )
-        row.pack(fill="x", pady=1)
-        row.pack_propagate(False)
-    
+        row.tk_cells = []
+
+        # Type icon, time range and duration badge, drawn on one canvas
+        row.cells = self._cell_canvas(row, VAMP_CELLS_W, [
+            (None, 16, "📍", ("Segoe UI", 12), COLOR_TEXT),
+            ('time_text', 95, "", ("Consolas", 10), "#558855"),
+            ('dur_text', 186.5, "", ("Consolas", 9), COLOR_TEXT_DIM),
+        ])
+        row.cells.pack(side="left")
 
-        
-        # Type icon
-        icon_color = "#ffff00" if is_current else COLOR_MARKER
-        ctk.CTkLabel(
-            row, text="📍", width=24,
-            font=("Segoe UI", 12)
-        ).pack(side="left", padx=(4, 2))
-        
-        # Time range
-        time_text = f"{self._format_time(loop.start)} → {self._format_time(loop.end)}"
-        duration = loop.end - loop.start
-        
-        ctk.CTkLabel(
-            row, text=time_text,
-            font=("Consolas", 10),
-            text_color="#66bb6a" if is_selected else "#558855",
-            width=130
-        ).pack(side="left", padx=(0, 4))
-        
-        # Duration badge
-        ctk.CTkLabel(
-            row, text=f"({duration:.1f}s)",
-            font=("Consolas", 9),
-            text_color=COLOR_TEXT_DIM,
-            width=45
-        ).pack(side="left", padx=(0, 6))
-        
         # Name (clickable to select this vamp)
-        name_color = "#aaffaa" if is_selected else COLOR_TEXT
-        name_btn = ctk.CTkButton(
+        row.name_btn = ctk.CTkButton(
             row,
-            text=loop.name,
+            text="",
             anchor="w",
             height=22,
-            font=("Segoe UI", 11, "bold" if is_selected else "normal"),
+            font=_name_font(False),
             fg_color="transparent",
             hover_color=COLOR_BG_LIGHT,
-            text_color=name_color,
-            command=lambda idx=loop_idx: self._on_select_vamp_row(idx)
+            command=lambda: self._on_select_vamp_row(row.ref_id)
         )
-        name_btn.pack(side="left", fill="x", expand=True, padx=2)
-        
-        # Selected indicator
-        if is_selected and is_current:
-            ctk.CTkLabel(
-                row, text="⬤",  # Solid circle for both
-                font=("Segoe UI", 10),
-                text_color="#66ff66",
-                width=16
-            ).pack(side="right", padx=(0, 2))
-        elif is_selected:
-            ctk.CTkLabel(
-                row, text="▶",
-                font=("Segoe UI", 10),
-                text_color="#66bb6a",
-                width=16
-            ).pack(side="right", padx=(0, 2))
-        elif is_current:
-            ctk.CTkLabel(
-                row, text="▶",
-                font=("Segoe UI", 10),
-                text_color="#ffff00",
-                width=16
-            ).pack(side="right", padx=(0, 2))
-        
+        row.name_btn.pack(side="left", fill="x", expand=True, padx=2)
+
+        # Selected / current indicator (packed only when shown)
+        row.indicator = self._cell_canvas(row, 16, [
+            ('indicator_text', 8, "▶", ("Segoe UI", 10), "#ffff00"),
+        ])
+
         # ACTION BUTTONS (right side)
-        
+
         # Delete button
-        btn_del = ctk.CTkButton(
+        row.btn_del = ctk.CTkButton(
             row, text="✕", width=28, height=22,
             fg_color="transparent",
             hover_color="#442222",
             text_color="#aa4444",
-            command=lambda idx=loop_idx: self._on_delete_vamp_row(idx)
+            command=lambda: self._on_delete_vamp_row(row.ref_id)
         )
-        btn_del.pack(side="right", padx=2)
-        ToolTip(btn_del, "Delete this vamp")
-        
+        row.btn_del.pack(side="right", padx=2)
+        self._row_tips.register(row.btn_del, "Delete this vamp")
+
         # Rename button
-        btn_ren = ctk.CTkButton(
+        row.btn_ren = ctk.CTkButton(
             row, text="✏", width=28, height=22,
             fg_color="transparent",
             hover_color=COLOR_BG_LIGHT,
             text_color=COLOR_TEXT_DIM,
-            command=lambda idx=loop_idx, ln=loop.name: self._on_rename_vamp_row(idx, ln)
+            command=lambda: self._on_rename_vamp_row(row.ref_id, row.data.name)
         )
-        btn_ren.pack(side="right", padx=2)
-        ToolTip(btn_ren, "Rename this vamp")
-        
+        row.btn_ren.pack(side="right", padx=2)
+        self._row_tips.register(row.btn_ren, "Rename this vamp")
+
         # Settings button (⚙️)
-        btn_set = ctk.CTkButton(
+        row.btn_set = ctk.CTkButton(
             row, text="⚙️", width=28, height=22,
             fg_color=COLOR_BG_LIGHT,
             hover_color="#555555",
             text_color=COLOR_TEXT,
-            command=lambda idx=loop_idx: self._on_open_settings_row(idx)
+            command=lambda: self._on_open_settings_row(row.ref_id)
         )
-        btn_set.pack(side="right", padx=2)
-        ToolTip(btn_set, "Open vamp settings (crossfade, boundaries)")
-        
+        row.btn_set.pack(side="right", padx=2)
+        self._row_tips.register(row.btn_set, "Open vamp settings (crossfade, boundaries)")
+
         # Play/Jump button
-        btn_play = ctk.CTkButton(
+        row.btn_play = ctk.CTkButton(
             row, text="▶", width=28, height=22,
-            fg_color=COLOR_BTN_SUCCESS if is_selected else COLOR_BG_LIGHT,
+            fg_color=COLOR_BG_LIGHT,
             hover_color=COLOR_BTN_SUCCESS,
-            text_color="#ffffff" if is_selected else COLOR_TEXT,
-            command=lambda idx=loop_idx: self._on_jump_to_vamp_row(idx)
+            text_color=COLOR_TEXT,
+            command=lambda: self._on_jump_to_vamp_row(row.ref_id)
         )
-        btn_play.pack(side="right", padx=2)
-        ToolTip(btn_play, "Jump to this vamp and start playing")
-        
+        row.btn_play.pack(side="right", padx=2)
+        self._row_tips.register(row.btn_play, "Jump to this vamp and start playing")
+
         return row
+
+    def _refresh_vamp_row(self, row, loop, loop_idx, is_selected, is_current=False):
+        """Bind a pooled row to a vamp (loop region)."""
+        # Highlight: selected OR current
+        self._apply_row_style(row, self._row_style('vamp', loop, loop_idx, is_current))
+
+        row.cells.itemconfigure(
+            row.time_text,
+            text=loop.time_label,
+            fill="#66bb6a" if is_selected else "#558855"
+        )
+        row.cells.itemconfigure(row.dur_text, text=loop.duration_label)
+
+        row.name_btn.configure(
+            text=loop.name,
+            font=_name_font(is_selected),
+            text_color="#aaffaa" if is_selected else COLOR_TEXT
+        )
+
+        # Selected indicator
+        if is_selected and is_current:
+            indicator = ("⬤", "#66ff66")  # Solid circle for both
+        elif is_selected:
+            indicator = ("▶", "#66bb6a")
+        elif is_current:
+            indicator = ("▶", "#ffff00")
+        else:
+            indicator = None
+
+        if indicator:
+            row.indicator.itemconfigure(row.indicator_text, text=indicator[0], fill=indicator[1])
+            row.indicator.pack(side="right", padx=(0, 2), before=row.btn_del)
+        else:
+            row.indicator.pack_forget()
+
+        row.btn_play.configure(
+            fg_color=COLOR_BTN_SUCCESS if is_selected else COLOR_BG_LIGHT,
+            text_color="#ffffff" if is_selected else COLOR_TEXT
+        )
     
     # =========================================================================
     # HANDLERS - CUE POINTS
@@ -631,64 +945,52 @@ class CueSheetPanel(ctk.CTkFrame):
             self.on_jump_to_marker(marker_id)
     
     def _on_rename_marker(self, marker_id, current_name):
-        dialog = ctk.CTkInputDialog(
-            text="Rename cue point:",
-            title="Rename Cue"
+        # Open once the click handler has returned; the dialog reports
+        # back through a callback instead of a nested event loop
+        self.after_idle(
+            self._show_rename_dialog, "Rename cue point:", "Rename Cue",
+            partial(self._on_rename_marker_result, marker_id)
         )
-        new_name = dialog.get_input()
+
+    def _on_rename_marker_result(self, marker_id, new_name):
         if new_name and new_name.strip() and self.on_rename_marker:
             self.on_rename_marker(marker_id, new_name.strip())
+
+    def _show_rename_dialog(self, text, title, on_result):
+        """Show the shared rename prompt, building it on first use."""
+        if self._rename_dialog is not None and self._rename_dialog.winfo_exists():
+            self._rename_dialog.rebind(text, title, on_result)
+        else:
+            self._rename_dialog = AsyncInputDialog(
+                self, text=text, title=title, on_result=on_result
+            )
     
     def _on_delete_marker(self, marker_id):
         if self.on_delete_marker:
             self.on_delete_marker(marker_id)
     
     def _on_prev(self):
-        """Jump to previous item (marker or vamp) in timeline."""
-        # Build unified sorted list
-        items = []
-        for marker in self._markers:
-            items.append((marker.time, 'marker', marker.id, None))
-        for i, loop in enumerate(self._loops):
-            items.append((loop.start, 'vamp', None, i))
-        
-        items.sort(key=lambda x: x[0])
-        
-        if not items:
-            return
-        
-        # Find previous item before current position
-        for i in range(len(items) - 1, -1, -1):
-            time, item_type, marker_id, loop_idx = items[i]
-            if time < self._current_position - 0.5:  # Must be at least 0.5s back
-                if item_type == 'marker':
-                    self.on_jump_to_marker(marker_id)
-                else:
-                    self.on_jump_to_vamp(loop_idx)
-                return
+        """Jump to previous item (marker, vamp or cut) in timeline."""
+        # Last item at least 0.5s back from the current position
+        i = bisect_left(self._timeline_times, self._current_position - 0.5) - 1
+        if i >= 0:
+            self._jump_to_timeline_item(i)
 
     def _on_next(self):
-        """Jump to next item (marker or vamp) in timeline."""
-        # Build unified sorted list
-        items = []
-        for marker in self._markers:
-            items.append((marker.time, 'marker', marker.id, None))
-        for i, loop in enumerate(self._loops):
-            items.append((loop.start, 'vamp', None, i))
-        
-        items.sort(key=lambda x: x[0])
-        
-        if not items:
-            return
-        
-        # Find next item after current position
-        for time, item_type, marker_id, loop_idx in items:
-            if time > self._current_position + 0.1:  # Small buffer
-                if item_type == 'marker':
-                    self.on_jump_to_marker(marker_id)
-                else:
-                    self.on_jump_to_vamp(loop_idx)
-                return
+        """Jump to next item (marker, vamp or cut) in timeline."""
+        # First item after the current position (small buffer)
+        i = bisect_right(self._timeline_times, self._current_position + 0.1)
+        if i < len(self._sorted_items):
+            self._jump_to_timeline_item(i)
+
+    def _jump_to_timeline_item(self, i):
+        _, item_type, data, ref_id = self._sorted_items[i]
+        if item_type == 'marker':
+            self.on_jump_to_marker(data.id)
+        elif item_type == 'vamp':
+            self.on_jump_to_vamp(ref_id)
+        elif self.on_jump_to_skip:
+            self.on_jump_to_skip(ref_id)
     
     # =========================================================================
     # HANDLERS - VAMPS
@@ -718,11 +1020,12 @@ class CueSheetPanel(ctk.CTkFrame):
     
     def _on_rename_vamp_row(self, loop_idx, current_name):
         """Rename a vamp (clicking ✏ button)."""
-        dialog = ctk.CTkInputDialog(
-            text="Rename vamp:",
-            title="Rename Vamp"
+        self.after_idle(
+            self._show_rename_dialog, "Rename vamp:", "Rename Vamp",
+            partial(self._on_rename_vamp_result, loop_idx)
         )
-        new_name = dialog.get_input()
+
+    def _on_rename_vamp_result(self, loop_idx, new_name):
         if new_name and new_name.strip() and self.on_rename_vamp:
             self.on_rename_vamp(loop_idx, new_name.strip())
     
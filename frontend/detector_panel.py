@@ -11,7 +11,9 @@ import customtkinter as ctk
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BTN_PRIMARY, COLOR_BTN_WARNING, COLOR_BTN_SUCCESS,
@@ -31,6 +33,9 @@ class DetectorPanel(ctk.CTkFrame):
         self.on_mode_change = on_mode_change # New callback
         self.mode = "loop" # "loop" or "cut"
         
+        # Result rows are built once and reused across show_results calls
+        self._result_rows = []
+        
         self._create_widgets()
 
     def _create_widgets(self):
@@ -71,6 +76,9 @@ class DetectorPanel(ctk.CTkFrame):
         # Results List Frame
         self.results_frame = ctk.CTkScrollableFrame(self, height=100, fg_color=COLOR_BG_MEDIUM)
         self.results_frame.pack(fill="x", expand=True)
+        
+        # Empty-state label, packed only when a search found nothing
+        self._empty_label = ctk.CTkLabel(self.results_frame, text="No loops found in selection")
 
     def _on_mode_switch(self, value):
         self.mode = "loop" if value == "Find Loops" else "cut"
@@ -105,38 +113,53 @@ class DetectorPanel(ctk.CTkFrame):
         self.status_lbl.configure(text="")
         
         # Clear results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        self._hide_results()
+
+    def _hide_results(self):
+        """Unpack all result rows and the empty label (kept for reuse)."""
+        self._empty_label.pack_forget()
+        for row in self._result_rows:
+            row.pack_forget()
+
+    def _create_result_row(self):
+        """Build a reusable result row; its buttons act on row.candidate."""
+        row = ctk.CTkFrame(self.results_frame, fg_color="transparent")
+        row.candidate = None
+        
+        row.label = ctk.CTkLabel(row, text="", font=("Consolas", 11))
+        row.label.pack(side="left", padx=5)
+        
+        btn_use = ctk.CTkButton(
+            row, text="Use", width=40, height=20, fg_color=COLOR_BTN_SUCCESS,
+            command=lambda: self.on_use(row.candidate)
+        )
+        btn_use.pack(side="right", padx=2)
+        ToolTip(btn_use, "Create a vamp/cut from this candidate and return to cue sheet")
+        
+        btn_preview = ctk.CTkButton(
+            row, text="▶", width=30, height=20, fg_color=COLOR_BTN_PRIMARY,
+            command=lambda: self.on_preview(row.candidate)
+        )
+        btn_preview.pack(side="right", padx=2)
+        ToolTip(btn_preview, "Preview this loop candidate")
+        return row
 
     def show_results(self, candidates):
         self.status_lbl.configure(text=f"Found {len(candidates)} loops")
         self.btn_find.configure(state="normal")
         
         # Clear old
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        self._hide_results()
 
         if not candidates:
-            ctk.CTkLabel(self.results_frame, text="No loops found in selection").pack()
+            self._empty_label.pack()
             return
 
-        for c in candidates:
-            row = ctk.CTkFrame(self.results_frame, fg_color="transparent")
+        # Grow the pool only when this result set is larger than any before
+        while len(self._result_rows) < len(candidates):
+            self._result_rows.append(self._create_result_row())
+
+        for row, c in zip(self._result_rows, candidates):
+            row.candidate = c
+            row.label.configure(text=f"{c.confidence}% | {c.duration:.2f}s")
             row.pack(fill="x", pady=2)
-            
-            txt = f"{c.confidence}% | {c.duration:.2f}s"
-            ctk.CTkLabel(row, text=txt, font=("Consolas", 11)).pack(side="left", padx=5)
-            
-            btn_use = ctk.CTkButton(
-                row, text="Use", width=40, height=20, fg_color=COLOR_BTN_SUCCESS,
-                command=lambda x=c: self.on_use(x)
-            )
-            btn_use.pack(side="right", padx=2)
-            ToolTip(btn_use, "Create a vamp/cut from this candidate and return to cue sheet")
-            
-            btn_preview = ctk.CTkButton(
-                row, text="▶", width=30, height=20, fg_color=COLOR_BTN_PRIMARY,
-                command=lambda x=c: self.on_preview(x)
-            )
-            btn_preview.pack(side="right", padx=2)
-            ToolTip(btn_preview, "Preview this loop candidate")
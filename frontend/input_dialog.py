@@ -0,0 +1,119 @@
+"""
+Non-blocking text prompt for Loop Station.
+
+Replacement for ctk.CTkInputDialog.get_input(), which waits in a nested
+event loop inside the calling handler. This dialog returns immediately
+and delivers its result through a callback instead.
+"""
+
+import logging
+import tkinter as tk
+from typing import Callable, Optional
+
+import customtkinter as ctk
+
+import sys
+import os
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from config import (
+    COLOR_BG_MEDIUM, COLOR_BG_LIGHT, COLOR_BTN_PRIMARY, COLOR_BTN_TEXT,
+    COLOR_TEXT, PADDING_MEDIUM, PADDING_LARGE,
+)
+
+logger = logging.getLogger("LoopStation.InputDialog")
+
+
+class AsyncInputDialog(ctk.CTkToplevel):
+    """
+    Single-line text prompt that never blocks its caller.
+
+    OK / Return calls on_result(text); Cancel / Escape / closing the
+    window calls on_result(None). The dialog is hidden by the time
+    on_result runs.
+
+    The window is built once and reused: closing it withdraws it, and
+    rebind() shows it again with a new prompt and callback.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        text: str,
+        title: str,
+        on_result: Callable[[Optional[str]], None],
+    ):
+        super().__init__(parent)
+
+        self._on_result = on_result
+
+        self.title(title)
+        self.resizable(False, False)
+        self.configure(fg_color=COLOR_BG_MEDIUM)
+        self.transient(parent.winfo_toplevel())
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        self._create_widgets(text)
+        # CTkToplevel maps a little after creation; focus once it is up
+        self.after(150, self._focus_entry)
+
+    def _create_widgets(self, text: str):
+        """Create prompt label, entry and buttons."""
+        self.label = ctk.CTkLabel(
+            self, text=text,
+            font=("Segoe UI", 12),
+            text_color=COLOR_TEXT,
+            wraplength=260, justify="left"
+        )
+        self.label.pack(fill="x", padx=PADDING_LARGE, pady=(PADDING_LARGE, PADDING_MEDIUM))
+
+        self.entry = ctk.CTkEntry(self, width=260, font=("Segoe UI", 12))
+        self.entry.pack(fill="x", padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
+        self.entry.bind("<Return>", lambda e: self._on_ok())
+        self.entry.bind("<Escape>", lambda e: self._on_cancel())
+
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
+
+        ctk.CTkButton(
+            buttons, text="Cancel", width=100,
+            fg_color=COLOR_BG_LIGHT, text_color=COLOR_TEXT,
+            command=self._on_cancel
+        ).pack(side="right")
+
+        ctk.CTkButton(
+            buttons, text="OK", width=100,
+            fg_color=COLOR_BTN_PRIMARY, text_color=COLOR_BTN_TEXT,
+            command=self._on_ok
+        ).pack(side="right", padx=(0, PADDING_MEDIUM))
+
+    def rebind(self, text: str, title: str, on_result: Callable[[Optional[str]], None]):
+        """Show the hidden dialog again for another prompt."""
+        self._on_result = on_result
+        self.title(title)
+        self.label.configure(text=text)
+        self.entry.delete(0, "end")
+        self.deiconify()
+        self._focus_entry()
+
+    def _focus_entry(self):
+        try:
+            self.lift()
+            self.entry.focus_force()
+        except tk.TclError:
+            pass  # Dialog was closed before it got focus
+
+    def _on_ok(self):
+        self._finish(self.entry.get())
+
+    def _on_cancel(self):
+        self._finish(None)
+
+    def _finish(self, value: Optional[str]):
+        """Hide the dialog, then report value (at most once)."""
+        callback, self._on_result = self._on_result, None
+        self.withdraw()
+        if callback:
+            callback(value)
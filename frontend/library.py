@@ -11,12 +11,15 @@ import tkinter as tk
 import platform
 import subprocess
 import threading
+from functools import lru_cache
 from typing import Callable, Optional, List
 
 import customtkinter as ctk
 
 import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BG_MEDIUM, COLOR_BG_LIGHT, COLOR_TEXT, COLOR_TEXT_DIM,
@@ -24,9 +27,38 @@ from config import (
     PADDING_SMALL, PADDING_MEDIUM, COLOR_BTN_TEXT,
 )
 from utils.tooltip import ToolTip
+from .virtual_list import VirtualList
 
 logger = logging.getLogger("LoopStation.Library")
 
+# Song list geometry (unscaled px). Rows are virtualized: only the ones
+# intersecting the viewport (plus overscan) exist as widgets.
+SONG_ROW_INNER_H = 32
+SONG_ROW_PAD = 1
+SONG_ROW_H = SONG_ROW_INNER_H + 2 * SONG_ROW_PAD
+SONG_OVERSCAN_ROWS = 2
+
+# Worker-result polling: check quickly while a fast answer is likely,
+# then back off so a long-open dialog or slow share costs few wakeups
+POLL_FAST_MS = 10
+POLL_SLOW_MS = 100
+POLL_FAST_WINDOW_MS = 1000
+
+# Lowercased audio extensions, for a set lookup per directory entry
+_EXT_SET = frozenset(ext.lower() for ext in SUPPORTED_FORMATS)
+
+
+def _poll_delay(elapsed_ms: int) -> int:
+    """Next polling delay for a worker that has been running elapsed_ms."""
+    return POLL_FAST_MS if elapsed_ms < POLL_FAST_WINDOW_MS else POLL_SLOW_MS
+
+
+@lru_cache(maxsize=None)
+def _get_theme_names() -> tuple:
+    """Sorted theme names for the theme menu, computed once per process."""
+    from themes import THEMES
+    return tuple(sorted(THEMES))
+
 
 class LibrarySidebar(ctk.CTkFrame):
     """
@@ -45,12 +77,37 @@ class LibrarySidebar(ctk.CTkFrame):
         
         self.current_folder: str = ""
         self.songs: List[str] = []
+        self._song_display: List[str] = []
         self.current_song: str = ""
-        self.song_buttons: List[ctk.CTkButton] = []
+        self._song_index_map = {}
+        self._selected_idx: int = -1
+        
+        # Virtualized song list (see VirtualList) and its unbound spare rows
+        self._free_rows = []
+        self._song_rows = None
         
         # Threading state for folder picker
         self._picker_thread = None
         self._picker_result = None
+        self._picker_done = threading.Event()
+        self._picker_after = None
+        
+        # Shared hover tooltip window, created on first show
+        self._shared_tip = None
+        self._tip_label = None
+        self._tip_after = None
+        
+        # Threading state for folder scans
+        self._scan_thread = None
+        self._scan_results = {}  # request_id -> (folder_path, songs, display)
+        self._scan_request_id = 0
+        self._scan_after = None
+        
+        # Row colors as instance attributes for the hover/selection paths,
+        # which run on every pointer move across the list
+        self._c_selected = COLOR_BTN_PRIMARY
+        self._c_hover = COLOR_BG_LIGHT
+        self._c_text = COLOR_TEXT
         
         self._create_widgets()
         logger.debug("LibrarySidebar initialized")
@@ -82,7 +139,6 @@ class LibrarySidebar(ctk.CTkFrame):
         ToolTip(self.btn_browse, "Browse for a folder of music files")
 
         # --- NEW: Theme Selector ---
-        from themes import THEMES
         from utils.preferences import set_theme_preference
 
         def change_theme(new_theme):
@@ -97,7 +153,7 @@ class LibrarySidebar(ctk.CTkFrame):
 
         ctk.CTkLabel(theme_frame, text="🎨 Theme:", font=("Segoe UI", 11), text_color=COLOR_TEXT_DIM).pack(side="left")
 
-        theme_names = sorted(list(THEMES.keys()))
+        theme_names = list(_get_theme_names())
         
         self.theme_menu = ctk.CTkOptionMenu(
             theme_frame,
@@ -132,6 +188,29 @@ class LibrarySidebar(ctk.CTkFrame):
         )
         self.song_list_frame.pack(fill="both", expand=True, padx=PADDING_SMALL, pady=PADDING_SMALL)
         
+        # Only the rows in view exist, so the whole library scrolls without
+        # a widget per song
+        self._song_rows = VirtualList(
+            self.song_list_frame, SONG_ROW_H, SONG_ROW_PAD,
+            acquire=self._acquire_row,
+            bind=self._bind_song_row,
+            release=self._release_row,
+            overscan=SONG_OVERSCAN_ROWS,
+            bg=COLOR_BG_MEDIUM,
+        )
+        
+        # One delegated handler each for clicks, hover and leave instead of
+        # per-row bindings. They hang off a bindtag that only the pooled
+        # rows carry (see _create_song_row), so the rest of the app never
+        # runs them.
+        self._rows_by_path = {}
+        self._row_path_prefix = str(self.song_list_frame) + "."
+        self._hover_row = None
+        self._row_tag = f"SongRow{id(self)}"
+        self.bind_class(self._row_tag, "<Button-1>", self._dispatch_click, add="+")
+        self.bind_class(self._row_tag, "<Motion>", self._dispatch_motion, add="+")
+        self.bind_class(self._row_tag, "<Leave>", self._dispatch_leave, add="+")
+        
         # Song count label
         self.count_label = ctk.CTkLabel(
             self,
@@ -141,22 +220,49 @@ class LibrarySidebar(ctk.CTkFrame):
         )
         self.count_label.pack(pady=PADDING_SMALL)
     
+    def destroy(self):
+        """Cancel pending polls and the tooltip timer before tearing down.
+        
+        The song list's window render is cancelled by VirtualList.
+        """
+        for attr in ('_tip_after', '_picker_after', '_scan_after'):
+            self._cancel_after(attr)
+        super().destroy()
+    
+    def _cancel_after(self, attr: str):
+        """Cancel the after() job whose id is stored in attr, if any."""
+        after_id = getattr(self, attr)
+        if after_id is not None:
+            try:
+                self.after_cancel(after_id)
+            except tk.TclError:
+                pass
+            setattr(self, attr, None)
+    
     def _browse_folder(self):
         """Start the folder picker process."""
         self.btn_browse.configure(state="disabled")
         
         # Reset result
         self._picker_result = None
+        self._picker_done.clear()
         
         # Start worker thread
         self._picker_thread = threading.Thread(target=self._worker_browse, daemon=True)
         self._picker_thread.start()
         
         # Start polling for result on Main Thread
-        self.after(100, self._check_picker_thread)
+        self._picker_after = self.after(POLL_FAST_MS, self._check_picker_thread, POLL_FAST_MS)
 
     def _worker_browse(self):
         """Run the actual OS dialog in a background thread to prevent Main Thread freeze."""
+        try:
+            self._run_browse()
+        finally:
+            self._picker_done.set()
+    
+    def _run_browse(self):
+        """Body of _worker_browse; stores the outcome in _picker_result."""
         folder = None
         
         # 1. macOS Robust Fix (AppleScript)
@@ -192,11 +298,13 @@ class LibrarySidebar(ctk.CTkFrame):
         else:
             self._picker_result = "CANCELLED"
 
-    def _check_picker_thread(self):
+    def _check_picker_thread(self, elapsed_ms: int = 0):
         """Poll for the picker thread result."""
+        self._picker_after = None
         # Case 1: Thread is still running
-        if self._picker_thread and self._picker_thread.is_alive():
-            self.after(100, self._check_picker_thread)
+        if not self._picker_done.is_set():
+            delay = _poll_delay(elapsed_ms)
+            self._picker_after = self.after(delay, self._check_picker_thread, elapsed_ms + delay)
             return
 
         # Case 2: Thread finished
@@ -221,120 +329,268 @@ class LibrarySidebar(ctk.CTkFrame):
             self.load_folder(result)
     
     def load_folder(self, folder_path: str):
-        """Load songs from a folder."""
+        """
+        Load songs from a folder.
+        
+        The directory is enumerated on a worker thread so slow disks and
+        network shares never block the UI; results are applied by
+        _check_scan_thread on the main thread.
+        """
+        # Tag the scan so results from an older, slower scan are dropped
+        self._scan_request_id += 1
+        request_id = self._scan_request_id
+        
+        self._scan_thread = threading.Thread(
+            target=self._scan_worker, args=(request_id, folder_path), daemon=True
+        )
+        self._scan_thread.start()
+        self._cancel_after('_scan_after')
+        self._scan_after = self.after(POLL_FAST_MS, self._check_scan_thread, request_id, POLL_FAST_MS)
+    
+    def _scan_worker(self, request_id: int, folder_path: str):
+        """Enumerate audio files in a background thread (no Tk calls here)."""
         if not os.path.isdir(folder_path):
             logger.warning(f"Not a valid folder: {folder_path}")
+            songs = None
+        else:
+            # Find audio files (skip hidden/metadata files)
+            songs = []
+            try:
+                with os.scandir(folder_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        # Skip hidden files (Unix-style dot files, macOS resource forks)
+                        # macOS creates "._SongName.mp3" AppleDouble metadata files that
+                        # match audio extensions but aren't playable audio.
+                        if name.startswith('.'):
+                            continue
+                        if os.path.splitext(name)[1].lower() not in _EXT_SET:
+                            continue
+                        if entry.is_file():
+                            songs.append(name)
+            except Exception as e:
+                logger.error(f"Error reading folder: {e}")
+                songs = None
+            else:
+                songs.sort()
+        
+        # Display names are computed here, once per load, so binding rows
+        # on scroll is a plain list index
+        display = None if songs is None else [os.path.splitext(song)[0] for song in songs]
+        # Results are keyed by request so a slow older scan can never
+        # overwrite a newer one; superseded results are simply dropped
+        if request_id == self._scan_request_id:
+            self._scan_results[request_id] = (folder_path, songs, display)
+    
+    def _check_scan_thread(self, request_id: int, elapsed_ms: int = 0):
+        """Poll for the folder scan result on the main thread."""
+        self._scan_after = None
+        # A newer load_folder superseded this scan; its own poll takes over
+        if request_id != self._scan_request_id:
+            return
+        
+        # Check liveness before looking for the result: the worker stores
+        # it before exiting, so dead + missing means it will never arrive
+        alive = self._scan_thread is not None and self._scan_thread.is_alive()
+        result = self._scan_results.pop(request_id, None)
+        if result is None:
+            if alive:
+                delay = _poll_delay(elapsed_ms)
+                self._scan_after = self.after(
+                    delay, self._check_scan_thread, request_id, elapsed_ms + delay
+                )
             return
         
+        self._scan_results.clear()
+        folder_path, songs, display = result
+        if songs is not None:
+            self._apply_folder_results(folder_path, songs, display)
+    
+    def _apply_folder_results(self, folder_path: str, songs: List[str], display: List[str]):
+        """Show a finished folder scan in the song list."""
         self.current_folder = folder_path
         self.folder_label.configure(text=os.path.basename(folder_path))
+        self.songs = songs
+        self._song_display = display
+        self._song_index_map = {song: i for i, song in enumerate(songs)}
+        self._selected_idx = self._song_index_map.get(self.current_song, -1)
         
-        # Clear existing buttons
-        for btn in self.song_buttons:
-            btn.destroy()
-        self.song_buttons.clear()
-        self._song_labels = []
+        # Return bound rows to the pool and re-render from the top
+        self._song_rows.reset(len(songs), to_top=True)
         
-        # Find audio files (skip hidden/metadata files)
-        self.songs = []
-        try:
-            for filename in sorted(os.listdir(folder_path)):
-                # Skip hidden files (Unix-style dot files, macOS resource forks)
-                # macOS creates "._SongName.mp3" AppleDouble metadata files that
-                # match audio extensions but aren't playable audio.
-                if filename.startswith('.'):
-                    continue
-                if filename.lower().endswith(SUPPORTED_FORMATS):
-                    self.songs.append(filename)
-        except Exception as e:
-            logger.error(f"Error reading folder: {e}")
+        self.count_label.configure(text=f"{len(self.songs)} songs")
+        logger.info(f"Loaded {len(self.songs)} songs from {folder_path}")
+    
+    def _acquire_row(self, idx):
+        """Spare row for the virtual list, building one if none are free."""
+        return self._free_rows.pop() if self._free_rows else self._create_song_row()
+    
+    def _create_song_row(self):
+        """Build a reusable song row; bound to a song by _bind_song_row."""
+        row = ctk.CTkFrame(
+            self.song_list_frame, fg_color="transparent",
+            height=SONG_ROW_INNER_H, corner_radius=4, cursor="hand2"
+        )
+        row.pack_propagate(False)
+        row.song = None
+        row.display_name = ""
+        # Last applied colors, see _set_row_colors
+        row.shown_fg = "transparent"
+        row.shown_text = COLOR_TEXT
+        
+        row.label = ctk.CTkLabel(
+            row, text="",
+            anchor="w",
+            font=("Segoe UI", 11),
+            text_color=COLOR_TEXT,
+        )
+        row.label.pack(side="left", fill="x", expand=True, padx=(10, 5))
+        
+        # Clicks, hover and tooltips are dispatched by the delegated
+        # handlers bound in _create_widgets, which resolve rows by path.
+        # Tag the row and its CTk internals so those handlers see them.
+        self._rows_by_path[str(row)] = row
+        pending = [row]
+        while pending:
+            widget = pending.pop()
+            widget.bindtags((self._row_tag,) + widget.bindtags())
+            pending.extend(widget.winfo_children())
+        return row
+    
+    def _bind_song_row(self, row, idx: int):
+        """Point a pooled row at songs[idx] and style it for the current selection."""
+        row.song = self.songs[idx]
+        row.display_name = self._song_display[idx]
+        row.label.configure(text=row.display_name)
+        self._style_song_row(row, idx == self._selected_idx)
+    
+    def _release_row(self, row):
+        """Return a row hidden by the virtual list to the pool."""
+        row.song = None
+        if row is self._hover_row:
+            self._hover_row = None
+            self._hide_tip()
+        self._free_rows.append(row)
+    
+    def _style_song_row(self, row, selected: bool):
+        """Apply selected / normal colors to a row."""
+        if selected:
+            self._set_row_colors(row, self._c_selected, "#ffffff")
+        else:
+            self._set_row_colors(row, "transparent", self._c_text)
+    
+    def _on_row_hover(self, row, entered: bool):
+        """Hover highlight for unselected rows."""
+        if row.song is None or row.song == self.current_song:
             return
+        self._set_row_colors(row, self._c_hover if entered else "transparent", self._c_text)
+    
+    @staticmethod
+    def _set_row_colors(row, fg_color: str, text_color: str):
+        """
+        Configure a row's colors, skipping whichever already match.
         
-        # Create rows for each song
-        for song in self.songs:
-            display_name = os.path.splitext(song)[0]
-            
-            row = ctk.CTkFrame(
-                self.song_list_frame, fg_color="transparent",
-                height=32, corner_radius=4, cursor="hand2"
-            )
-            row.pack(fill="x", pady=1)
-            row.pack_propagate(False)
-            
-            lbl = ctk.CTkLabel(
-                row, text=display_name,
-                anchor="w",
-                font=("Segoe UI", 11),
-                text_color=COLOR_TEXT,
-            )
-            lbl.pack(side="left", fill="x", expand=True, padx=(10, 5))
-            
-            # Click handlers on both frame and label
-            row.bind("<Button-1>", lambda e, s=song: self._on_song_click(s))
-            lbl.bind("<Button-1>", lambda e, s=song: self._on_song_click(s))
-            
-            # Hover effects
-            row.bind("<Enter>", lambda e, r=row: r.configure(fg_color=COLOR_BG_LIGHT))
-            row.bind("<Leave>", lambda e, r=row: r.configure(fg_color="transparent"))
-            
-            self.song_buttons.append(row)
-            self._song_labels = getattr(self, '_song_labels', [])
-            self._song_labels.append(lbl)
-            
+        Each CTk configure redraws the widget's canvas, so re-binding a
+        row on scroll or moving the hover only pays for real changes.
+        """
+        if row.shown_fg != fg_color:
+            row.shown_fg = fg_color
+            row.configure(fg_color=fg_color)
+        if row.shown_text != text_color:
+            row.shown_text = text_color
+            row.label.configure(text_color=text_color)
+    
+    def _row_for_widget(self, widget):
+        """
+        Resolve any widget inside a song row (frame, label, or their CTk
+        internals) to that row, or None.
+        
+        Tk path names are hierarchical, so the row is the first path
+        component below the list frame; no parent walk is needed.
+        """
+        path = str(widget)
+        prefix = self._row_path_prefix
+        if not path.startswith(prefix):
+            return None
+        return self._rows_by_path.get(prefix + path[len(prefix):].split(".", 1)[0])
+    
+    def _dispatch_click(self, event):
+        """Delegated <Button-1>: load the song under the pointer."""
+        row = self._row_for_widget(event.widget)
+        if row is not None and row.song is not None:
+            self._on_song_click(row.song)
+    
+    def _dispatch_motion(self, event):
+        """Delegated <Motion>: track which row is hovered."""
+        self._set_hover_row(self._row_for_widget(event.widget))
+    
+    def _dispatch_leave(self, event):
+        """Delegated <Leave>: clear the hover once the pointer left the rows."""
+        if self._hover_row is not None:
+            self.after_idle(self._sync_hover)
+    
+    def _sync_hover(self):
+        """Re-resolve the hovered row from the pointer position."""
+        try:
+            x, y = self.winfo_pointerxy()
+            widget = self.winfo_containing(x, y)
+        except (KeyError, tk.TclError):
+            widget = None
+        self._set_hover_row(self._row_for_widget(widget))
+    
+    def _set_hover_row(self, row):
+        """Move the hover highlight and tooltip from the previous row to row."""
+        prev = self._hover_row
+        if row is prev:
+            return
+        self._hover_row = row
+        if prev is not None:
+            self._on_row_hover(prev, False)
+        self._hide_tip()
+        if row is not None and row.song is not None:
+            self._on_row_hover(row, True)
             # Tooltip on hover for long names
-            self._add_tooltip(row, display_name)
+            self._tip_after = self.after(500, self._show_tip, row, row.display_name)
+    
+    def _show_tip(self, widget, text: str):
+        """Move the shared tooltip window next to widget and show text in it."""
+        self._tip_after = None
+        if self._shared_tip is None:
+            tw = tk.Toplevel(self)
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            # Platform-safe: skip attributes that may not work everywhere
+            try:
+                tw.attributes("-topmost", True)
+            except Exception:
+                pass
+            self._tip_label = tk.Label(
+                tw, justify="left",
+                background="#333333", foreground="#ffffff",
+                relief="solid", borderwidth=1,
+                font=("Segoe UI", 10),
+                padx=6, pady=3
+            )
+            self._tip_label.pack()
+            self._shared_tip = tw
         
-        self.count_label.configure(text=f"{len(self.songs)} songs")
-        logger.info(f"Loaded {len(self.songs)} songs from {folder_path}")
+        x = widget.winfo_rootx() + widget.winfo_width() + 5
+        y = widget.winfo_rooty()
+        self._tip_label.configure(text=text)
+        self._shared_tip.wm_geometry(f"+{x}+{y}")
+        self._shared_tip.deiconify()
     
-    def _truncate_name(self, name: str, max_length: int = 35) -> str:
-        """Truncate filename for display."""
-        name_no_ext = os.path.splitext(name)[0]
-        if len(name_no_ext) > max_length:
-            return name_no_ext[:max_length-3] + "..."
-        return name_no_ext
+    def _cancel_tip(self):
+        """Cancel a pending tooltip show."""
+        if self._tip_after:
+            self.after_cancel(self._tip_after)
+            self._tip_after = None
     
-    def _add_tooltip(self, widget, text):
-        """Add a hover tooltip to a widget. Shows full text after a short delay."""
-        tip_window = [None]  # Use list for mutability in closures
-        after_id = [None]
-        
-        def show(event):
-            def _create():
-                if tip_window[0]:
-                    return
-                x = widget.winfo_rootx() + widget.winfo_width() + 5
-                y = widget.winfo_rooty()
-                tw = tk.Toplevel(widget)
-                tw.wm_overrideredirect(True)
-                tw.wm_geometry(f"+{x}+{y}")
-                # Platform-safe: skip attributes that may not work everywhere
-                try:
-                    tw.attributes("-topmost", True)
-                except Exception:
-                    pass
-                label = tk.Label(
-                    tw, text=text, justify="left",
-                    background="#333333", foreground="#ffffff",
-                    relief="solid", borderwidth=1,
-                    font=("Segoe UI", 10),
-                    padx=6, pady=3
-                )
-                label.pack()
-                tip_window[0] = tw
-            after_id[0] = widget.after(500, _create)
-        
-        def hide(event):
-            if after_id[0]:
-                widget.after_cancel(after_id[0])
-                after_id[0] = None
-            tw = tip_window[0]
-            if tw:
-                tw.destroy()
-                tip_window[0] = None
-        
-        widget.bind("<Enter>", show, add="+")
-        widget.bind("<Leave>", hide, add="+")
+    def _hide_tip(self):
+        """Hide the shared tooltip window (kept for the next hover)."""
+        self._cancel_tip()
+        if self._shared_tip is not None:
+            self._shared_tip.withdraw()
     
     def _on_song_click(self, filename: str):
         """Handle song button click."""
@@ -345,21 +601,18 @@ class LibrarySidebar(ctk.CTkFrame):
     def set_current_song(self, filename: str):
         """Highlight the currently loaded song."""
         self.current_song = filename
-        labels = getattr(self, '_song_labels', [])
-        
-        for i, song in enumerate(self.songs):
-            if i >= len(self.song_buttons) or i >= len(labels):
-                break
-            if song == filename:
-                self.song_buttons[i].configure(fg_color=COLOR_BTN_PRIMARY)
-                labels[i].configure(text_color="#ffffff")
-                # Disable hover color change for selected item
-                self.song_buttons[i].bind("<Enter>", lambda e: None)
-                self.song_buttons[i].bind("<Leave>", lambda e: None)
-            else:
-                self.song_buttons[i].configure(fg_color="transparent")
-                labels[i].configure(text_color=COLOR_TEXT)
-                # Re-enable hover
-                row = self.song_buttons[i]
-                row.bind("<Enter>", lambda e, r=row: r.configure(fg_color=COLOR_BG_LIGHT))
-                row.bind("<Leave>", lambda e, r=row: r.configure(fg_color="transparent"))
+        
+        new_idx = self._song_index_map.get(filename, -1)
+        old_idx = self._selected_idx
+        self._selected_idx = new_idx
+        if new_idx == old_idx:
+            return
+        
+        # Restyle only the outgoing and incoming rows, and only if they are
+        # in the viewport; others pick up the selection when bound on scroll
+        old_row = self._song_rows.rows.get(old_idx)
+        if old_row is not None:
+            self._style_song_row(old_row, False)
+        new_row = self._song_rows.rows.get(new_idx)
+        if new_row is not None:
+            self._style_song_row(new_row, True)
@@ -13,14 +13,18 @@ Contains:
 """
 
 import logging
+import re
 import tkinter as tk
+from functools import partial
 from typing import Callable, Optional
 
 import customtkinter as ctk
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BTN_PRIMARY, COLOR_BTN_SUCCESS, COLOR_BTN_WARNING, 
@@ -29,9 +33,24 @@ from config import (
     BTN_HEIGHT, BTN_FONT_SIZE, PADDING_SMALL, PADDING_MEDIUM,
     FADE_EXIT_DURATION_MS, FADE_EXIT_MIN_MS, FADE_EXIT_MAX_MS, COLOR_BTN_TEXT
 )
+from .input_dialog import AsyncInputDialog
 
 logger = logging.getLogger("LoopStation.LoopControls")
 
+# Loop time entry: "SS.ms" or "M:SS.ms", surrounding whitespace allowed
+_TIME_RE = re.compile(r'^\s*(?:(\d+):)?(\d+(?:\.\d*)?|\.\d+)\s*$')
+
+# Exit / fade-exit button styles keyed by set_exit_enabled's (enabled, active)
+_EXIT_BTN_CFG = {
+    (True, True): {"state": "normal", "fg_color": COLOR_BTN_SUCCESS, "text": "⮑ EXIT"},
+    (True, False): {"state": "normal", "fg_color": COLOR_BTN_PRIMARY, "text": "⮑ EXIT"},
+    (False, False): {"state": "disabled", "fg_color": COLOR_BTN_DISABLED, "text": "⮑ EXIT"},
+}
+_FADE_BTN_CFG = {
+    True: {"state": "normal", "fg_color": COLOR_BTN_WARNING},
+    False: {"state": "disabled", "fg_color": COLOR_BTN_DISABLED},
+}
+
 
 class LoopControls(ctk.CTkFrame):
     """
@@ -78,9 +97,40 @@ class LoopControls(ctk.CTkFrame):
         self._loop_out = 0.0
         self._current_loops = []
         self._current_selected = -1
-        
-        self._create_widgets()
+        self._pending_entry_after: Optional[str] = None
+        # Per entry: text set_loop_points last wrote, and text it had to
+        # hold back while the user was typing (applied on <FocusOut>)
+        self._entry_written = {}
+        self._entry_deferred = {}
+        self._last_dur_text = None
+        self._last_idx_text = None
+        self._last_name_text = None
+        self._last_status_key: tuple = ()
+        self._rename_dialog: Optional[AsyncInputDialog] = None
+        # Last exit-button call, replayed once the widgets exist
+        self._exit_call = (self.set_exit_enabled, (False,))
+        # Exit-button state currently shown: (enabled, active), "waiting" or None
+        self._exit_state = None
+        
+        # Widgets are built on first <Map>; until then the public setters
+        # only record state (see _ensure_built)
+        self._built = False
+        self.bind("<Map>", self._ensure_built, add="+")
         logger.debug("LoopControls initialized")
+    
+    def _ensure_built(self, event=None):
+        """Build the widget tree the first time the panel is shown."""
+        if self._built:
+            return
+        self._built = True
+        self._create_widgets()
+        
+        # Replay state set while the panel was unbuilt
+        self.set_loop_points(self._loop_in, self._loop_out)
+        if self._current_loops:
+            self.update_loop_status(self._current_loops, self._current_selected)
+        method, args = self._exit_call
+        method(*args)
 
     def _create_widgets(self):
         """Create all loop control widgets."""
@@ -163,15 +213,14 @@ class LoopControls(ctk.CTkFrame):
         # =========================================================
         # 2. IN/OUT CONTROL ROW
         # =========================================================
+        # Buttons are packed straight into the row; section spacing comes
+        # from their padding rather than from per-section wrapper frames.
         top_row = ctk.CTkFrame(self, fg_color="transparent")
         top_row.pack(fill="x", pady=(0, PADDING_MEDIUM))
         
         # --- Loop IN section ---
-        in_frame = ctk.CTkFrame(top_row, fg_color="transparent")
-        in_frame.pack(side="left", padx=(0, PADDING_MEDIUM))
-        
         self.btn_set_in = ctk.CTkButton(
-            in_frame, text="⬇ SET IN", width=90, height=BTN_HEIGHT,
+            top_row, text="⬇ SET IN", width=90, height=BTN_HEIGHT,
             font=("Segoe UI", BTN_FONT_SIZE),
             fg_color=COLOR_LOOP_IN,
             text_color="#000000",
@@ -179,25 +228,19 @@ class LoopControls(ctk.CTkFrame):
         )
         self.btn_set_in.pack(side="left", padx=(0, PADDING_SMALL))
         
-        in_adj_frame = ctk.CTkFrame(in_frame, fg_color="transparent")
-        in_adj_frame.pack(side="left")
-        
         ctk.CTkButton(
-            in_adj_frame, text="−", width=30, height=28,
-            command=lambda: self._on_adjust_in(-0.01)
+            top_row, text="−", width=30, height=28,
+            command=partial(self._on_adjust_in, -0.01)
         ).pack(side="left", padx=1)
         
         ctk.CTkButton(
-            in_adj_frame, text="+", width=30, height=28,
-            command=lambda: self._on_adjust_in(0.01)
-        ).pack(side="left", padx=1)
+            top_row, text="+", width=30, height=28,
+            command=partial(self._on_adjust_in, 0.01)
+        ).pack(side="left", padx=(1, 1 + PADDING_MEDIUM))
         
         # --- Loop OUT section ---
-        out_frame = ctk.CTkFrame(top_row, fg_color="transparent")
-        out_frame.pack(side="left", padx=(0, PADDING_MEDIUM))
-        
         self.btn_set_out = ctk.CTkButton(
-            out_frame, text="⬇ SET OUT", width=90, height=BTN_HEIGHT,
+            top_row, text="⬇ SET OUT", width=90, height=BTN_HEIGHT,
             font=("Segoe UI", BTN_FONT_SIZE),
             fg_color=COLOR_LOOP_OUT,
             text_color="#000000",
@@ -205,33 +248,27 @@ class LoopControls(ctk.CTkFrame):
         )
         self.btn_set_out.pack(side="left", padx=(0, PADDING_SMALL))
         
-        out_adj_frame = ctk.CTkFrame(out_frame, fg_color="transparent")
-        out_adj_frame.pack(side="left")
-        
         ctk.CTkButton(
-            out_adj_frame, text="−", width=30, height=28,
-            command=lambda: self._on_adjust_out(-0.01)
+            top_row, text="−", width=30, height=28,
+            command=partial(self._on_adjust_out, -0.01)
         ).pack(side="left", padx=1)
         
         ctk.CTkButton(
-            out_adj_frame, text="+", width=30, height=28,
-            command=lambda: self._on_adjust_out(0.01)
-        ).pack(side="left", padx=1)
+            top_row, text="+", width=30, height=28,
+            command=partial(self._on_adjust_out, 0.01)
+        ).pack(side="left", padx=(1, 1 + PADDING_MEDIUM))
         
         # --- EXIT section (two buttons: hard exit + fade exit) ---
-        exit_frame = ctk.CTkFrame(top_row, fg_color="transparent")
-        exit_frame.pack(side="left", padx=(PADDING_MEDIUM, 0))
-        
         self.btn_exit = ctk.CTkButton(
-            exit_frame, text="⮑ EXIT", width=80, height=BTN_HEIGHT,
+            top_row, text="⮑ EXIT", width=80, height=BTN_HEIGHT,
             font=("Segoe UI", BTN_FONT_SIZE, "bold"),
             fg_color=COLOR_BTN_DISABLED, state="disabled",
             command=self._on_exit_click
         )
-        self.btn_exit.pack(side="left", padx=(0, 3))
+        self.btn_exit.pack(side="left", padx=(PADDING_MEDIUM, 3))
         
         self.btn_fade_exit = ctk.CTkButton(
-            exit_frame, text="🔉 FADE", width=75, height=BTN_HEIGHT,
+            top_row, text="🔉 FADE", width=75, height=BTN_HEIGHT,
             font=("Segoe UI", BTN_FONT_SIZE - 1),
             fg_color=COLOR_BTN_DISABLED, state="disabled",
             command=self._on_fade_exit_click
@@ -245,35 +282,29 @@ class LoopControls(ctk.CTkFrame):
         bottom_row.pack(fill="x")
         
         # Loop IN entry
-        in_entry_frame = ctk.CTkFrame(bottom_row, fg_color="transparent")
-        in_entry_frame.pack(side="left", padx=(0, PADDING_MEDIUM))
-        
         ctk.CTkLabel(
-            in_entry_frame, text="IN:", 
+            bottom_row, text="IN:", 
             font=("Segoe UI", 11), text_color=COLOR_LOOP_IN
         ).pack(side="left", padx=(0, PADDING_SMALL))
         
         self.entry_in = ctk.CTkEntry(
-            in_entry_frame, width=80, height=28, font=("Consolas", 11)
+            bottom_row, width=80, height=28, font=("Consolas", 11)
         )
-        self.entry_in.pack(side="left")
-        self.entry_in.bind("<Return>", self._on_entry_change)
+        self.entry_in.pack(side="left", padx=(0, PADDING_MEDIUM))
+        self.entry_in.bind("<Return>", self._on_entry_return)
         self.entry_in.bind("<FocusOut>", self._on_entry_change)
         
         # Loop OUT entry
-        out_entry_frame = ctk.CTkFrame(bottom_row, fg_color="transparent")
-        out_entry_frame.pack(side="left", padx=(0, PADDING_MEDIUM))
-        
         ctk.CTkLabel(
-            out_entry_frame, text="OUT:",
+            bottom_row, text="OUT:",
             font=("Segoe UI", 11), text_color=COLOR_LOOP_OUT
         ).pack(side="left", padx=(0, PADDING_SMALL))
         
         self.entry_out = ctk.CTkEntry(
-            out_entry_frame, width=80, height=28, font=("Consolas", 11)
+            bottom_row, width=80, height=28, font=("Consolas", 11)
         )
-        self.entry_out.pack(side="left")
-        self.entry_out.bind("<Return>", self._on_entry_change)
+        self.entry_out.pack(side="left", padx=(0, PADDING_MEDIUM))
+        self.entry_out.bind("<Return>", self._on_entry_return)
         self.entry_out.bind("<FocusOut>", self._on_entry_change)
         
         # Duration label
@@ -301,24 +332,45 @@ class LoopControls(ctk.CTkFrame):
         """Called from App when loops change."""
         self._current_loops = loops
         self._current_selected = selected_index
+        if not self._built:
+            return
+        
+        # Skip the label and entry updates when nothing shown has changed.
+        # The loops list is mutated in place, so identity plus length plus
+        # the selected loop's fields stand in for full equality.
+        if loops and 0 <= selected_index < len(loops):
+            loop = loops[selected_index]
+            key = (id(loops), len(loops), selected_index, loop.start, loop.end, loop.name)
+        else:
+            key = (id(loops), len(loops), selected_index, -1, -1, "")
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        
         total = len(loops)
         
         if total == 0:
-            self.lbl_loop_index.configure(text="")
-            self.lbl_vamp_name.configure(text="(no vamp)")
+            self._set_status_labels("", "(no vamp)")
             return
             
-        current = selected_index + 1
-        self.lbl_loop_index.configure(text=f"{current}/{total}")
-        
-        # Show vamp name
+        # Show index and vamp name
         loop = loops[selected_index]
-        display_name = loop.name[:20] + "…" if len(loop.name) > 20 else loop.name
-        self.lbl_vamp_name.configure(text=display_name)
+        name = loop.name
+        display_name = name if len(name) <= 20 else name[:20] + "…"
+        self._set_status_labels(f"{selected_index + 1}/{total}", display_name)
         
         # Update fields
         self.set_loop_points(loop.start, loop.end)
 
+    def _set_status_labels(self, idx_text: str, name_text: str):
+        """Update the index and name labels, skipping unchanged text."""
+        if idx_text != self._last_idx_text:
+            self._last_idx_text = idx_text
+            self.lbl_loop_index.configure(text=idx_text)
+        if name_text != self._last_name_text:
+            self._last_name_text = name_text
+            self.lbl_vamp_name.configure(text=name_text)
+
     def _add_loop(self):
         if self.on_add_loop:
             self.on_add_loop()
@@ -340,16 +392,26 @@ class LoopControls(ctk.CTkFrame):
         if self._current_selected < 0 or not self._current_loops:
             return
         
-        current_name = self._current_loops[self._current_selected].name
-        
-        dialog = ctk.CTkInputDialog(
-            text=f"Rename vamp:",
-            title="Rename Vamp"
-        )
-        new_name = dialog.get_input()
-        
+        # Open once the click handler has returned; the dialog reports
+        # back through _on_rename_result instead of a nested event loop
+        self.after_idle(self._show_rename_dialog, self._current_selected)
+    
+    def _show_rename_dialog(self, loop_idx: int):
+        on_result = partial(self._on_rename_result, loop_idx)
+        # The dialog is built on first rename and reused afterwards
+        if self._rename_dialog is not None and self._rename_dialog.winfo_exists():
+            self._rename_dialog.rebind("Rename vamp:", "Rename Vamp", on_result)
+        else:
+            self._rename_dialog = AsyncInputDialog(
+                self,
+                text="Rename vamp:",
+                title="Rename Vamp",
+                on_result=on_result
+            )
+    
+    def _on_rename_result(self, loop_idx: int, new_name: Optional[str]):
         if new_name and new_name.strip() and self.on_rename_loop:
-            self.on_rename_loop(self._current_selected, new_name.strip())
+            self.on_rename_loop(loop_idx, new_name.strip())
     
     # =========================================================================
     # EVENT HANDLERS
@@ -375,42 +437,58 @@ class LoopControls(ctk.CTkFrame):
         if self.on_exit_loop:
             self.on_exit_loop()
     
-    def _on_fade_exit_click(self):
+    def _on_fade_exit_click(self, _duration_ms: int = FADE_EXIT_DURATION_MS):
         """Trigger fade-out exit with configured duration."""
         if self.on_fade_exit:
-            self.on_fade_exit(FADE_EXIT_DURATION_MS)
+            self.on_fade_exit(_duration_ms)
     
     def _on_save_click(self):
         if self.on_save:
             self.on_save()
     
+    def _on_entry_return(self, event=None):
+        """Commit an entry on Enter by moving focus off it.
+        
+        <FocusOut> is then the only path into _on_entry_change, so Enter
+        does not report the same value twice.
+        """
+        self.focus_set()
+        return "break"
+    
     def _on_entry_change(self, event=None):
-        """Handle manual entry of loop times."""
-        try:
-            in_text = self.entry_in.get().strip()
-            out_text = self.entry_out.get().strip()
-            
-            in_val = self._parse_time(in_text)
-            out_val = self._parse_time(out_text)
-            
-            if in_val is not None and out_val is not None:
-                if out_val > in_val and self.on_loop_points_changed:
-                    self.on_loop_points_changed(in_val, out_val)
-        except Exception as e:
-            logger.warning(f"Error parsing loop time: {e}")
+        """
+        Handle manual entry of loop times (on <FocusOut>).
+        
+        Calls are coalesced into one _flush_entry_change shortly after
+        the last of them. Loop points that arrived while the user was
+        typing are newer than the typed text, so they are applied first.
+        """
+        for entry, text in self._entry_deferred.items():
+            self._write_entry(entry, text)
+        self._entry_deferred.clear()
+        if self._pending_entry_after:
+            self.after_cancel(self._pending_entry_after)
+        self._pending_entry_after = self.after(30, self._flush_entry_change)
+    
+    def _flush_entry_change(self):
+        """Parse both entries and report the new loop points once."""
+        self._pending_entry_after = None
+        # _parse_time returns None for anything _TIME_RE rejects, so
+        # there is nothing to catch here
+        in_val = self._parse_time(self.entry_in.get().strip())
+        out_val = self._parse_time(self.entry_out.get().strip())
+        
+        if in_val is not None and out_val is not None:
+            if out_val > in_val and self.on_loop_points_changed:
+                self.on_loop_points_changed(in_val, out_val)
     
     def _parse_time(self, text: str) -> Optional[float]:
         """Parse time string (M:SS.ms or just seconds) to float."""
-        try:
-            if ':' in text:
-                parts = text.split(':')
-                minutes = int(parts[0])
-                seconds = float(parts[1])
-                return minutes * 60 + seconds
-            else:
-                return float(text)
-        except:
+        m = _TIME_RE.match(text)
+        if not m:
             return None
+        minutes = int(m.group(1)) if m.group(1) else 0
+        return minutes * 60 + float(m.group(2))
     
     # =========================================================================
     # PUBLIC METHODS
@@ -420,28 +498,66 @@ class LoopControls(ctk.CTkFrame):
         """Update the displayed loop points."""
         self._loop_in = loop_in
         self._loop_out = loop_out
+        if not self._built:
+            return
         
-        self.entry_in.delete(0, "end")
-        self.entry_in.insert(0, f"{loop_in:.3f}")
-        
-        self.entry_out.delete(0, "end")
-        self.entry_out.insert(0, f"{loop_out:.3f}")
+        self._set_entry_text(self.entry_in, f"{loop_in:.3f}")
+        self._set_entry_text(self.entry_out, f"{loop_out:.3f}")
         
         duration = loop_out - loop_in
-        self.duration_label.configure(text=f"Duration: {duration:.3f}s")
+        dur_text = f"Duration: {duration:.3f}s"
+        if dur_text != self._last_dur_text:
+            self._last_dur_text = dur_text
+            self.duration_label.configure(text=dur_text)
+    
+    def _set_entry_text(self, entry, text: str):
+        """
+        Replace an entry's text, skipping the delete/insert when it already
+        shows text. While the user is typing in it (focused, and its text
+        differs from what we last wrote) the text is deferred to <FocusOut>.
+        """
+        current = entry.get()
+        if current == text:
+            self._entry_written[entry] = text
+            self._entry_deferred.pop(entry, None)
+            return
+        if current != self._entry_written.get(entry, "") and self._entry_has_focus(entry):
+            self._entry_deferred[entry] = text
+            return
+        self._entry_deferred.pop(entry, None)
+        self._write_entry(entry, text)
+    
+    def _write_entry(self, entry, text: str):
+        entry.delete(0, "end")
+        entry.insert(0, text)
+        self._entry_written[entry] = text
+    
+    def _entry_has_focus(self, entry) -> bool:
+        try:
+            focus = self.focus_get()
+        except (KeyError, tk.TclError):
+            return False
+        if focus is None:
+            return False
+        path, entry_path = str(focus), str(entry)
+        return path == entry_path or path.startswith(entry_path + ".")
     
     def set_exit_enabled(self, enabled: bool, active: bool = False):
         """Enable/disable exit buttons."""
-        if enabled:
-            color = COLOR_BTN_SUCCESS if active else COLOR_BTN_SUCCESS
-            self.btn_exit.configure(state="normal", fg_color=color, text="⮑ EXIT")
-            self.btn_fade_exit.configure(state="normal", fg_color=COLOR_BTN_WARNING)
-        else:
-            self.btn_exit.configure(state="disabled", fg_color=COLOR_BTN_DISABLED, text="⮑ EXIT")
-            self.btn_fade_exit.configure(state="disabled", fg_color=COLOR_BTN_DISABLED)
+        self._exit_call = (self.set_exit_enabled, (enabled, active))
+        state = (bool(enabled), bool(enabled and active))
+        if not self._built or state == self._exit_state:
+            return
+        self._exit_state = state
+        self.btn_exit.configure(**_EXIT_BTN_CFG[state])
+        self.btn_fade_exit.configure(**_FADE_BTN_CFG[state[0]])
     
     def set_exit_waiting(self):
         """Set exit button to waiting state."""
+        self._exit_call = (self.set_exit_waiting, ())
+        if not self._built or self._exit_state == "waiting":
+            return
+        self._exit_state = "waiting"
         self.btn_exit.configure(text="⌛ Exiting...", fg_color=COLOR_BTN_WARNING, state="disabled")
         self.btn_fade_exit.configure(state="disabled")
     
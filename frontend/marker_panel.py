@@ -7,22 +7,34 @@ Note: The section header is provided by CollapsibleSection in app.py.
 
 import logging
 import tkinter as tk
+from functools import partial
 from typing import Callable, Optional, List
 
 import customtkinter as ctk
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BTN_PRIMARY, COLOR_BTN_DANGER, COLOR_BTN_SUCCESS,
     COLOR_TEXT, COLOR_TEXT_DIM, COLOR_BG_LIGHT, COLOR_BG_MEDIUM,
     COLOR_MARKER, PADDING_SMALL, PADDING_MEDIUM,
 )
+from .input_dialog import AsyncInputDialog
+from .virtual_list import VirtualList
 
 logger = logging.getLogger("LoopStation.MarkerPanel")
 
+# Marker list geometry (unscaled px). Rows are virtualized: only the ones
+# intersecting the viewport (plus overscan) exist as widgets.
+MARKER_ROW_INNER_H = 24
+MARKER_ROW_PAD = 1
+MARKER_ROW_H = MARKER_ROW_INNER_H + 2 * MARKER_ROW_PAD
+MARKER_OVERSCAN_ROWS = 2
+
 
 class MarkerPanel(ctk.CTkFrame):
     """
@@ -49,9 +61,28 @@ class MarkerPanel(ctk.CTkFrame):
         self.on_jump_next = on_jump_next
         self.on_jump_prev = on_jump_prev
         
-        self._marker_widgets = []
+        # Virtualized marker list (see VirtualList) and its unbound spare rows
+        self._markers = []
+        self._free_rows = []
+        self._rows = None
         
+        # Widgets are built on first <Map>; until then update_markers only
+        # records the list (see _ensure_built)
+        self._built = False
+        self._pending_markers = None
+        self._rename_dialog = None
+        self.bind("<Map>", self._ensure_built, add="+")
+    
+    def _ensure_built(self, event=None):
+        """Build the widget tree the first time the panel is shown."""
+        if self._built:
+            return
+        self._built = True
         self._create_widgets()
+        
+        markers, self._pending_markers = self._pending_markers, None
+        if markers is not None:
+            self.update_markers(markers)
     
     def _create_widgets(self):
         # Toolbar row (nav + add)
@@ -91,72 +122,113 @@ class MarkerPanel(ctk.CTkFrame):
             scrollbar_button_color=COLOR_BG_LIGHT
         )
         self.marker_list.pack(fill="x")
+        
+        # Empty-state label, packed only while there are no markers
+        self._empty_label = ctk.CTkLabel(
+            self.marker_list, 
+            text="No cue points yet.",
+            text_color=COLOR_TEXT_DIM, font=("Segoe UI", 10)
+        )
+        
+        # Only the rows in view exist; a row still showing the same marker
+        # after an update gets it back by id
+        self._rows = VirtualList(
+            self.marker_list, MARKER_ROW_H, MARKER_ROW_PAD,
+            acquire=self._acquire_row,
+            bind=lambda row, idx: self._bind_marker_row(row, self._markers[idx]),
+            release=self._free_rows.append,
+            key=lambda idx: self._markers[idx].id,
+            overscan=MARKER_OVERSCAN_ROWS,
+            bg=COLOR_BG_MEDIUM,
+        )
     
     def update_markers(self, markers):
-        """Update the displayed marker list."""
-        for widget in self._marker_widgets:
-            widget.destroy()
-        self._marker_widgets.clear()
+        """
+        Update the displayed marker list.
         
-        if not markers:
-            lbl = ctk.CTkLabel(
-                self.marker_list, 
-                text="No cue points yet.",
-                text_color=COLOR_TEXT_DIM, font=("Segoe UI", 10)
-            )
-            lbl.pack(pady=5)
-            self._marker_widgets.append(lbl)
+        Only rows in the viewport exist. They are pooled across updates,
+        and a row still showing the same marker only reconfigures what changed.
+        """
+        if not self._built:
+            self._pending_markers = markers
             return
         
-        for marker in markers:
-            row = ctk.CTkFrame(self.marker_list, fg_color="transparent")
-            row.pack(fill="x", pady=1)
-            self._marker_widgets.append(row)
-            
-            # Time badge
-            minutes = int(marker.time // 60)
-            secs = marker.time % 60
-            time_str = f"{minutes}:{secs:05.2f}"
-            
-            time_lbl = ctk.CTkLabel(
-                row, text=time_str,
-                font=("Consolas", 10),
-                text_color=COLOR_MARKER,
-                width=60
-            )
-            time_lbl.pack(side="left", padx=(5, 5))
-            
-            # Name (clickable to jump)
-            name_btn = ctk.CTkButton(
-                row, 
-                text=marker.name,
-                anchor="w",
-                height=22,
-                font=("Segoe UI", 11),
-                fg_color="transparent",
-                hover_color=COLOR_BG_LIGHT,
-                text_color=COLOR_TEXT,
-                command=lambda mid=marker.id: self._on_jump(mid)
-            )
-            name_btn.pack(side="left", fill="x", expand=True, padx=2)
-            
-            # Rename
-            rename_btn = ctk.CTkButton(
-                row, text="✏", width=25, height=20,
-                fg_color="transparent", hover_color=COLOR_BG_LIGHT,
-                text_color=COLOR_TEXT_DIM,
-                command=lambda mid=marker.id, mname=marker.name: self._on_rename(mid, mname)
-            )
-            rename_btn.pack(side="right", padx=1)
-            
-            # Delete
-            del_btn = ctk.CTkButton(
-                row, text="✕", width=25, height=20,
-                fg_color="transparent", hover_color="#442222",
-                text_color="#aa4444",
-                command=lambda mid=marker.id: self._on_delete(mid)
-            )
-            del_btn.pack(side="right", padx=1)
+        self._markers = list(markers)
+        
+        if not markers:
+            self._empty_label.pack(pady=5)
+        else:
+            self._empty_label.pack_forget()
+        self._rows.reset(len(self._markers))
+    
+    def _acquire_row(self, idx):
+        """Spare row for the virtual list, building one if none are free."""
+        return self._free_rows.pop() if self._free_rows else self._create_marker_row()
+    
+    def _bind_marker_row(self, row, marker):
+        """Point a pooled row at a marker, reconfiguring only what changed."""
+        if row.marker_id != marker.id:
+            row.marker_id = marker.id
+            row.name_btn.configure(command=partial(self._on_jump, marker.id))
+            row.rename_btn.configure(command=partial(self._on_rename, marker.id))
+            row.del_btn.configure(command=partial(self._on_delete, marker.id))
+        
+        # Time badge (Marker caches its formatted label)
+        time_str = marker.time_label
+        if row.time_str != time_str:
+            row.time_str = time_str
+            row.time_lbl.configure(text=time_str)
+        
+        if row.marker_name != marker.name:
+            row.marker_name = marker.name
+            row.name_btn.configure(text=marker.name)
+    
+    def _create_marker_row(self):
+        """Build a reusable marker row; bound to a marker by _bind_marker_row."""
+        row = ctk.CTkFrame(self.marker_list, fg_color="transparent", height=MARKER_ROW_INNER_H)
+        row.pack_propagate(False)
+        row.marker_id = None
+        row.time_str = None
+        row.marker_name = None
+        
+        # Time badge
+        row.time_lbl = ctk.CTkLabel(
+            row, text="",
+            font=("Consolas", 10),
+            text_color=COLOR_MARKER,
+            width=60
+        )
+        row.time_lbl.pack(side="left", padx=(5, 5))
+        
+        # Name (clickable to jump)
+        row.name_btn = ctk.CTkButton(
+            row, 
+            text="",
+            anchor="w",
+            height=22,
+            font=("Segoe UI", 11),
+            fg_color="transparent",
+            hover_color=COLOR_BG_LIGHT,
+            text_color=COLOR_TEXT
+        )
+        row.name_btn.pack(side="left", fill="x", expand=True, padx=2)
+        
+        # Rename
+        row.rename_btn = ctk.CTkButton(
+            row, text="✏", width=25, height=20,
+            fg_color="transparent", hover_color=COLOR_BG_LIGHT,
+            text_color=COLOR_TEXT_DIM
+        )
+        row.rename_btn.pack(side="right", padx=1)
+        
+        # Delete
+        row.del_btn = ctk.CTkButton(
+            row, text="✕", width=25, height=20,
+            fg_color="transparent", hover_color="#442222",
+            text_color="#aa4444"
+        )
+        row.del_btn.pack(side="right", padx=1)
+        return row
     
     def _on_add(self):
         if self.on_add_marker:
@@ -166,12 +238,25 @@ class MarkerPanel(ctk.CTkFrame):
         if self.on_jump_to_marker:
             self.on_jump_to_marker(marker_id)
     
-    def _on_rename(self, marker_id, current_name):
-        dialog = ctk.CTkInputDialog(
-            text="Rename cue point:",
-            title="Rename Cue"
-        )
-        new_name = dialog.get_input()
+    def _on_rename(self, marker_id):
+        # Open once the click handler has returned; the dialog reports
+        # back through _on_rename_result instead of a nested event loop
+        self.after_idle(self._show_rename_dialog, marker_id)
+    
+    def _show_rename_dialog(self, marker_id):
+        on_result = partial(self._on_rename_result, marker_id)
+        # The dialog is built on first rename and reused afterwards
+        if self._rename_dialog is not None and self._rename_dialog.winfo_exists():
+            self._rename_dialog.rebind("Rename cue point:", "Rename Cue", on_result)
+        else:
+            self._rename_dialog = AsyncInputDialog(
+                self,
+                text="Rename cue point:",
+                title="Rename Cue",
+                on_result=on_result
+            )
+    
+    def _on_rename_result(self, marker_id, new_name):
         if new_name and new_name.strip() and self.on_rename_marker:
             self.on_rename_marker(marker_id, new_name.strip())
     
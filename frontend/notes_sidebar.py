@@ -13,26 +13,55 @@ where they are in the show and what's coming up next.
 import logging
 import time
 import tkinter as tk
-from typing import Callable, Optional, List
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Callable, Optional
 
 import customtkinter as ctk
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BG_DARK, COLOR_BG_MEDIUM, COLOR_BG_LIGHT,
-    COLOR_TEXT, COLOR_TEXT_DIM, COLOR_MARKER, COLOR_LOOP_REGION,
-    COLOR_BTN_PRIMARY, COLOR_BTN_SUCCESS, COLOR_BTN_DANGER,
-    PADDING_SMALL, PADDING_MEDIUM, PADDING_LARGE,
-    AVAILABLE_TAGS, TAG_COLORS, COLOR_BTN_TEXT,
+    COLOR_TEXT, COLOR_TEXT_DIM, COLOR_MARKER,
+    COLOR_BTN_SUCCESS,
+    PADDING_SMALL, PADDING_MEDIUM,
+    AVAILABLE_TAGS, TAG_COLORS,
     RIGHT_SIDEBAR_WIDTH,
 )
 from utils.tooltip import ToolTip
 
 logger = logging.getLogger("LoopStation.NotesSidebar")
 
+# Minimum seconds between full current/next evaluations during playback;
+# position updates in between only tick the countdown
+CUE_EVAL_INTERVAL_S = 0.25
+
+
+@lru_cache(maxsize=1024)
+def _format_countdown(tenths):
+    """Countdown text for a remaining time given in tenths of a second."""
+    if tenths <= 0:
+        return "NOW"
+    seconds = tenths / 10
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes = int(seconds // 60)
+    secs = int(seconds % 60)
+    return f"{minutes}:{secs:02d}"
+
+
+def _content_key(item):
+    """What the NOW/NEXT panels show of an item, for change detection."""
+    if item is None:
+        return None
+    return (item.id, item.name, tuple(item.tag_notes.items()))
+
 
 class NotesSidebar(ctk.CTkFrame):
     """
@@ -52,17 +81,47 @@ class NotesSidebar(ctk.CTkFrame):
         self.on_tag_remove = on_tag_remove
         
         # State
-        self._timeline_items = []
+        # Timeline as parallel per-item columns, sorted by start time
+        self._item_times = []      # start time
+        self._item_ends = []       # vamp end; inf for markers, which never end
+        self._item_types = []      # 'marker' or 'vamp'
+        self._item_objs = []       # the Marker / LoopRegion itself
+        self._item_ids = []        # obj.id
+        self._prev_marker = []     # index of the last marker at or before each item, or -1
+        self._timeline_key = None  # identity + timing of what the columns were built from
+        self._vamp_end_max = []    # running max vamp end over items[:i + 1]
+        self._vamp_ends = []       # end time of every vamp, sorted
+        # Position range over which the last current/next lookup holds:
+        # (start_lo, start_hi, end_lo, end_hi), or None to force a lookup
+        self._cue_bounds = None
         self._current_position = 0.0
         self._current_item = None
         self._next_item = None
         self._current_item_type = None
         self._next_item_type = None
-        self._last_countdown_update = 0
+        self._last_countdown_update = 0.0  # time.monotonic() of the last full evaluation
+        self._eval_job = None  # trailing evaluation for updates inside the throttle window
+        self._countdown_key = None  # (tenths, colour) last shown by the countdown
+        
+        # While hidden, cue tracking continues (the web view reads it) but
+        # widgets are left alone until set_visible(True) catches them up
+        self._visible = True
+        self._display_stale = False
+        
+        # Sections ('now', 'next', 'edit') whose widgets are waiting for the
+        # idle refresh scheduled by _mark_dirty
+        self._dirty_sections = set()
+        self._refresh_job = None
+        # _content_key() of the items the NOW/NEXT panels were last built for
+        self._shown_current_key = None
+        self._shown_next_key = None
         
         # Tag card widgets (managed dynamically)
         self._tag_cards = []
         
+        # Options last applied per widget by _set()
+        self._shown_options = {}
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -120,6 +179,10 @@ class NotesSidebar(ctk.CTkFrame):
         # Container for per-tag note summaries in NOW section
         self.current_tags_notes = ctk.CTkFrame(self.current_frame, fg_color="transparent")
         self.current_tags_notes.pack(fill="x", padx=PADDING_SMALL, pady=(4, PADDING_SMALL))
+        self.current_tags_notes.summary_rows = []
+        self.current_tags_notes.rows_shown = 0
+        self.current_tags_notes.empty_label = None
+        self.current_tags_notes.empty_shown = False
         
         # ==========================================================
         # SECTION 2: UP NEXT (with countdown)
@@ -167,6 +230,10 @@ class NotesSidebar(ctk.CTkFrame):
         # Container for per-tag note summaries in NEXT section
         self.next_tags_notes = ctk.CTkFrame(self.next_frame, fg_color="transparent")
         self.next_tags_notes.pack(fill="x", padx=PADDING_SMALL, pady=(0, PADDING_SMALL))
+        self.next_tags_notes.summary_rows = []
+        self.next_tags_notes.rows_shown = 0
+        self.next_tags_notes.empty_label = None
+        self.next_tags_notes.empty_shown = False
         
         # ==========================================================
         # SECTION 3: EDIT TAGS & NOTES
@@ -215,6 +282,14 @@ class NotesSidebar(ctk.CTkFrame):
     # HELPERS
     # =========================================================================
     
+    def _set(self, widget, **options):
+        """configure() a widget, skipping options that already have that value."""
+        shown = self._shown_options.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if shown.get(k) != v}
+        if changed:
+            shown.update(changed)
+            widget.configure(**changed)
+    
     def _section_header(self, parent, text):
         ctk.CTkLabel(
             parent, text=text,
@@ -227,103 +302,254 @@ class NotesSidebar(ctk.CTkFrame):
     
     def update_timeline(self, markers, loops):
         """Rebuild internal timeline from current markers and loops."""
+        # Loop selection changes and renames arrive here too but leave the
+        # timeline as it was; only re-sort when an item or its timing moved.
+        # The old objects are still referenced by _item_objs, so their ids
+        # cannot have been reused.
+        key = (
+            tuple((id(m), m.time) for m in (markers or [])),
+            tuple((id(l), l.start, l.end) for l in (loops or [])),
+        )
+        if key == self._timeline_key:
+            self._evaluate_cues(self._current_position)
+            self._check_shown_content()
+            return
+        self._timeline_key = key
+        
         items = []
         for marker in (markers or []):
             items.append((marker.time, 'marker', marker))
         for loop in (loops or []):
             items.append((loop.start, 'vamp', loop))
         items.sort(key=lambda x: x[0])
-        self._timeline_items = items
+        
+        times, ends, types, objs, ids = [], [], [], [], []
+        # Non-decreasing, so the first vamp still running at a position
+        # can be found with bisect
+        vamp_end_max = []
+        running = float("-inf")
+        prev_marker = []  # index of the last marker at or before each item
+        last_marker = -1
+        for i, (t, item_type, obj) in enumerate(items):
+            end = obj.end if item_type == 'vamp' else float("inf")
+            times.append(t)
+            ends.append(end)
+            types.append(item_type)
+            objs.append(obj)
+            ids.append(obj.id)
+            if item_type == 'vamp' and end > running:
+                running = end
+            vamp_end_max.append(running)
+            if item_type == 'marker':
+                last_marker = i
+            prev_marker.append(last_marker)
+        # Time columns are packed doubles so bisect compares in C
+        self._item_times = array('d', times)
+        self._item_ends = array('d', ends)
+        self._item_types = types
+        self._item_objs = objs
+        self._item_ids = ids
+        self._vamp_end_max = array('d', vamp_end_max)
+        self._prev_marker = array('l', prev_marker)
+        self._vamp_ends = array('d', sorted(end for end, item_type in zip(ends, types) if item_type == 'vamp'))
+        self._cue_bounds = None
         self._evaluate_cues(self._current_position)
+        self._check_shown_content()
+    
+    def _check_shown_content(self):
+        """Queue a NOW/NEXT refresh if a shown item was renamed or re-tagged."""
+        if _content_key(self._current_item) != self._shown_current_key:
+            self._mark_dirty('now')
+        if _content_key(self._next_item) != self._shown_next_key:
+            self._mark_dirty('next')
+    
+    def set_visible(self, visible):
+        """Tell the sidebar whether it is on screen; called when it is toggled."""
+        self._visible = visible
+        if visible and self._display_stale:
+            self._refresh_display()
+    
+    def _refresh_display(self):
+        """Bring every section up to date with the tracked current/next items."""
+        self._display_stale = False
+        self._dirty_sections.clear()
+        if not self._item_times:
+            self._set_empty()
+            return
+        position = self._current_position
+        self._refresh_current(position)
+        self._refresh_next(position)
+        self._rebuild_tag_cards()
     
     def update_position(self, position, is_playing=True):
         """Update current playback position."""
         self._current_position = position
         
-        now = time.time()
-        if now - self._last_countdown_update < 0.25:
+        now = time.monotonic()
+        wait = CUE_EVAL_INTERVAL_S - (now - self._last_countdown_update)
+        if wait > 0:
             self._update_countdown_only(position)
+            # Evaluate the latest position once the window closes, so the
+            # last update of a burst (e.g. just before pausing) isn't lost
+            if self._eval_job is None:
+                self._eval_job = self.after(int(wait * 1000) + 1, self._flush_position)
             return
         
         self._last_countdown_update = now
         self._evaluate_cues(position)
     
+    def _flush_position(self):
+        """Trailing evaluation of the most recent position."""
+        self._eval_job = None
+        self._last_countdown_update = time.monotonic()
+        self._evaluate_cues(self._current_position)
+    
     def _evaluate_cues(self, position):
         """Determine current and next cue, update displays."""
-        if not self._timeline_items:
+        times = self._item_times
+        if not times:
             self._set_empty()
             return
         
-        current = None
-        current_type = None
-        next_item = None
-        next_type = None
+        # Current/next only change when the position crosses an item start
+        # or a vamp end. Between those, reuse the last lookup (the common
+        # case during playback) and just tick the countdown.
+        bounds = self._cue_bounds
+        if (bounds is not None
+                and bounds[0] <= position < bounds[1]
+                and bounds[2] < position <= bounds[3]):
+            self._update_countdown_only(position)
+            return
         
-        # Pass 1: Find CURRENT item (last item we're inside/past)
-        for i, (t, item_type, obj) in enumerate(self._timeline_items):
-            item_time = obj.time if item_type == 'marker' else obj.start
-            
-            if item_time <= position:
-                if item_type == 'vamp' and position > obj.end:
-                    continue  # We've passed this vamp entirely
-                current = obj
-                current_type = item_type
-        
-        # Pass 2: Find NEXT item (first item whose start is after current position)
-        for i, (t, item_type, obj) in enumerate(self._timeline_items):
-            if item_type == 'marker':
-                item_time = obj.time
-            else:
-                item_time = obj.start
-            
-            if item_time > position:
-                next_item = obj
-                next_type = item_type
-                break
-            
-            # Also catch vamps we're before the end of but already past start
-            if item_type == 'vamp' and position <= obj.end and obj is not current:
-                next_item = obj
-                next_type = item_type
-                break
+        ends = self._item_ends
+        types = self._item_types
+        
+        # Items before `started` begin at or before the position
+        started = bisect_right(times, position)
+        
+        # CURRENT: last started item, skipping vamps we've passed entirely.
+        # Markers never end, so only vamps after the last started marker
+        # need checking, and none of them once every vamp so far has ended.
+        cur = started - 1
+        if cur >= 0:
+            floor = self._prev_marker[cur]
+            vamp_end_max = self._vamp_end_max
+            while cur > floor and position > ends[cur]:
+                if vamp_end_max[cur] < position:
+                    cur = floor
+                    break
+                cur -= 1
+        
+        # NEXT: the first vamp we're past the start of but before the end
+        # of (other than current), else the first item still to start
+        nxt = bisect_left(self._vamp_end_max, position, 0, started)
+        while nxt < started and (types[nxt] != 'vamp' or position > ends[nxt] or nxt == cur):
+            nxt += 1
+        
+        vamp_ends = self._vamp_ends
+        passed = bisect_left(vamp_ends, position)  # vamps that ended before position
+        self._cue_bounds = (
+            times[started - 1] if started else float("-inf"),
+            times[started] if started < len(times) else float("inf"),
+            vamp_ends[passed - 1] if passed else float("-inf"),
+            vamp_ends[passed] if passed < len(vamp_ends) else float("inf"),
+        )
         
         old_current_id = self._current_item.id if self._current_item else None
         old_next_id = self._next_item.id if self._next_item else None
         
-        self._current_item = current
-        self._current_item_type = current_type
-        self._next_item = next_item
-        self._next_item_type = next_type
+        objs = self._item_objs
+        ids = self._item_ids
+        if cur >= 0:
+            self._current_item = objs[cur]
+            self._current_item_type = types[cur]
+            new_current_id = ids[cur]
+        else:
+            self._current_item = None
+            self._current_item_type = None
+            new_current_id = None
+        if nxt < len(times):
+            self._next_item = objs[nxt]
+            self._next_item_type = types[nxt]
+            new_next_id = ids[nxt]
+        else:
+            self._next_item = None
+            self._next_item_type = None
+            new_next_id = None
         
-        new_current_id = current.id if current else None
-        new_next_id = next_item.id if next_item else None
+        if not self._visible:
+            if new_current_id != old_current_id or new_next_id != old_next_id:
+                self._display_stale = True
+            return
         
         # Only rebuild the tag summary widgets when the item identity changes,
         # NOT on every position tick — this prevents the visible flash/flicker.
+        # The rebuilds run together once Tk is idle.
         if new_current_id != old_current_id:
-            self._refresh_current(position)
+            self._mark_dirty('now', 'edit')
         
         if new_next_id != old_next_id:
-            self._refresh_next(position)
+            self._mark_dirty('next')
         
         # Update countdown (lightweight, no widget destruction)
         self._update_countdown_only(position)
+    
+    def _mark_dirty(self, *sections):
+        """Queue sections for the next idle refresh, scheduling it if needed."""
+        self._dirty_sections.update(sections)
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Refresh every section queued by _mark_dirty in one pass."""
+        self._refresh_job = None
+        dirty = self._dirty_sections
+        if not dirty:
+            return
+        self._dirty_sections = set()
+        if not self._visible:
+            self._display_stale = True
+            return
         
-        if new_current_id != old_current_id:
+        position = self._current_position
+        if 'now' in dirty:
+            self._refresh_current(position)
+        if 'next' in dirty:
+            self._refresh_next(position)
+        if 'edit' in dirty:
             self._rebuild_tag_cards()
     
+    def destroy(self):
+        """Cancel pending refresh/evaluation callbacks before tearing down."""
+        for job in (self._refresh_job, self._eval_job):
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except tk.TclError:
+                    pass
+        self._refresh_job = None
+        self._eval_job = None
+        super().destroy()
+    
     def _update_countdown_only(self, position):
         """Fast path: just update countdown number."""
-        if self._next_item:
+        if self._next_item and self._visible:
             next_time = self._next_item.time if self._next_item_type == 'marker' else self._next_item.start
             remaining = max(0, next_time - position)
-            self.countdown_label.configure(text=self._fmt_countdown(remaining))
             if remaining < 5:
-                self.countdown_label.configure(text_color="#ff4444")
+                color = "#ff4444"
             elif remaining < 15:
-                self.countdown_label.configure(text_color="#ffcc00")
+                color = "#ffcc00"
             else:
-                self.countdown_label.configure(text_color="#88cc88")
+                color = "#88cc88"
+            # The display has at most tenth-of-a-second resolution, so most
+            # ticks land on the same text and need no formatting at all
+            tenths = round(remaining * 10)
+            key = (tenths, color)
+            if key == self._countdown_key:
+                return
+            self._countdown_key = key
+            self._set(self.countdown_label, text=_format_countdown(tenths), text_color=color)
     
     # =========================================================================
     # DISPLAY: NOW SECTION
@@ -334,42 +560,51 @@ class NotesSidebar(ctk.CTkFrame):
         self._current_item_type = None
         self._next_item = None
         self._next_item_type = None
-        self.current_icon.configure(text="--")
-        self.current_name.configure(text="No active cue")
-        self.current_time.configure(text="")
-        self._clear_children(self.current_tags_notes)
-        self.countdown_label.configure(text="--:--", text_color="#555555")
-        self.next_icon.configure(text="")
-        self.next_name.configure(text="--")
-        self.next_time.configure(text="")
-        self._clear_children(self.next_tags_notes)
+        # Anything queued was for items that no longer exist
+        self._dirty_sections.clear()
+        self._shown_current_key = None
+        self._shown_next_key = None
+        if not self._visible:
+            self._display_stale = True
+            return
+        self._set(self.current_icon, text="--")
+        self._set(self.current_name, text="No active cue")
+        self._set(self.current_time, text="")
+        self._hide_tag_notes_summary(self.current_tags_notes)
+        self._set(self.countdown_label, text="--:--", text_color="#555555")
+        self._countdown_key = None
+        self._set(self.next_icon, text="")
+        self._set(self.next_name, text="--")
+        self._set(self.next_time, text="")
+        self._hide_tag_notes_summary(self.next_tags_notes)
     
     def _refresh_current(self, position):
         item = self._current_item
         itype = self._current_item_type
+        self._shown_current_key = _content_key(item)
         
         if item is None:
-            self.current_icon.configure(text="--")
-            self.current_name.configure(text="No active cue")
-            self.current_time.configure(text="")
-            self.current_frame.configure(fg_color="#1a1a1a")
-            self._clear_children(self.current_tags_notes)
+            self._set(self.current_icon, text="--")
+            self._set(self.current_name, text="No active cue")
+            self._set(self.current_time, text="")
+            self._set(self.current_frame, fg_color="#1a1a1a")
+            self._hide_tag_notes_summary(self.current_tags_notes)
             return
         
         if itype == 'marker':
-            self.current_icon.configure(text="📍")
-            self.current_time.configure(
-                text=f"at {self._fmt(item.time)}", text_color=COLOR_MARKER
+            self._set(self.current_icon, text="📍")
+            self._set(self.current_time,
+                text=f"at {item.time_label}", text_color=COLOR_MARKER
             )
-            self.current_frame.configure(fg_color="#2a2a1e")
+            self._set(self.current_frame, fg_color="#2a2a1e")
         else:
-            self.current_icon.configure(text="🔁")
-            self.current_time.configure(
-                text=f"{self._fmt(item.start)} → {self._fmt(item.end)}", text_color="#66bb6a"
+            self._set(self.current_icon, text="🔁")
+            self._set(self.current_time,
+                text=item.time_label, text_color="#66bb6a"
             )
-            self.current_frame.configure(fg_color="#1e2a1e")
+            self._set(self.current_frame, fg_color="#1e2a1e")
         
-        self.current_name.configure(text=item.name)
+        self._set(self.current_name, text=item.name)
         self._render_tag_notes_summary(self.current_tags_notes, item.tag_notes)
     
     # =========================================================================
@@ -379,74 +614,119 @@ class NotesSidebar(ctk.CTkFrame):
     def _refresh_next(self, position):
         item = self._next_item
         itype = self._next_item_type
+        self._shown_next_key = _content_key(item)
         
         if item is None:
-            self.countdown_label.configure(text="--:--", text_color="#555555")
-            self.next_icon.configure(text="")
-            self.next_name.configure(text="End of song")
-            self.next_time.configure(text="")
-            self._clear_children(self.next_tags_notes)
+            self._set(self.countdown_label, text="--:--", text_color="#555555")
+            self._countdown_key = None
+            self._set(self.next_icon, text="")
+            self._set(self.next_name, text="End of song")
+            self._set(self.next_time, text="")
+            self._hide_tag_notes_summary(self.next_tags_notes)
             return
         
         if itype == 'marker':
-            self.next_icon.configure(text="📍")
-            next_time = item.time
-            self.next_time.configure(
-                text=f"at {self._fmt(next_time)}", text_color=COLOR_MARKER
+            self._set(self.next_icon, text="📍")
+            self._set(self.next_time,
+                text=f"at {item.time_label}", text_color=COLOR_MARKER
             )
         else:
-            self.next_icon.configure(text="🔁")
-            next_time = item.start
-            self.next_time.configure(
-                text=f"{self._fmt(item.start)} → {self._fmt(item.end)}", text_color="#558855"
+            self._set(self.next_icon, text="🔁")
+            self._set(self.next_time,
+                text=item.time_label, text_color="#558855"
             )
         
-        self.next_name.configure(text=item.name)
-        
-        remaining = max(0, next_time - position)
-        self.countdown_label.configure(text=self._fmt_countdown(remaining))
-        if remaining < 5:
-            self.countdown_label.configure(text_color="#ff4444")
-        elif remaining < 15:
-            self.countdown_label.configure(text_color="#ffcc00")
-        else:
-            self.countdown_label.configure(text_color="#88cc88")
+        self._set(self.next_name, text=item.name)
+        self._update_countdown_only(position)
         
         self._render_tag_notes_summary(self.next_tags_notes, item.tag_notes)
     
     def _render_tag_notes_summary(self, parent, tag_notes):
-        """Render read-only tag+notes summary in NOW or NEXT section."""
-        self._clear_children(parent)
+        """
+        Render read-only tag+notes summary in NOW or NEXT section.
+        
+        Rows are pooled per section and only built once a tagged item
+        needs them: existing ones are reconfigured for the new tags and
+        any left over are hidden, never destroyed. Rows and the "(no tags)"
+        label are only packed/forgotten when their visibility changes.
+        """
+        rows = parent.summary_rows
         
         if not tag_notes:
-            ctk.CTkLabel(
-                parent, text="(no tags)", font=("Segoe UI", 10),
-                text_color=COLOR_TEXT_DIM
-            ).pack(anchor="w", padx=4, pady=2)
+            self._hide_summary_rows(parent, 0)
+            if parent.empty_shown:
+                return
+            if parent.empty_label is None:
+                parent.empty_label = ctk.CTkLabel(
+                    parent, text="(no tags)", font=("Segoe UI", 10),
+                    text_color=COLOR_TEXT_DIM
+                )
+            parent.empty_label.pack(anchor="w", padx=4, pady=2)
+            parent.empty_shown = True
             return
         
-        for tag, notes in tag_notes.items():
-            row = ctk.CTkFrame(parent, fg_color="transparent")
-            row.pack(fill="x", pady=1)
-            
-            color = TAG_COLORS.get(tag, "#555555")
-            ctk.CTkLabel(
-                row, text=f" {tag} ",
-                font=("Segoe UI", 9, "bold"),
-                fg_color=color, corner_radius=8,
-                text_color="#ffffff", height=18
-            ).pack(side="left", padx=(4, 6), pady=1)
+        if parent.empty_shown:
+            parent.empty_label.pack_forget()
+            parent.empty_shown = False
+        
+        for i, (tag, notes) in enumerate(tag_notes.items()):
+            if i < len(rows):
+                row = rows[i]
+            else:
+                row = self._create_summary_row(parent)
+                rows.append(row)
             
             display = notes.strip().replace('\n', ' ')
             if len(display) > 60:
                 display = display[:57] + "..."
             
-            ctk.CTkLabel(
-                row, text=display if display else "(empty)",
-                font=("Segoe UI", 10),
-                text_color=COLOR_TEXT if display else COLOR_TEXT_DIM,
-                anchor="w"
-            ).pack(side="left", fill="x", expand=True, padx=(0, 4))
+            self._set(row.badge, text=f" {tag} ", fg_color=TAG_COLORS.get(tag, "#555555"))
+            self._set(
+                row.notes_label,
+                text=display if display else "(empty)",
+                text_color=COLOR_TEXT if display else COLOR_TEXT_DIM
+            )
+            # Shown rows are always a prefix of the pool, so packing a
+            # hidden one appends it in order after them
+            if i >= parent.rows_shown:
+                row.pack(fill="x", pady=1)
+        
+        parent.rows_shown = max(parent.rows_shown, len(tag_notes))
+        self._hide_summary_rows(parent, len(tag_notes))
+    
+    def _create_summary_row(self, parent):
+        """Build a pooled tag badge + notes row; filled in by _render_tag_notes_summary."""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        
+        row.badge = ctk.CTkLabel(
+            row, text="",
+            font=("Segoe UI", 9, "bold"),
+            corner_radius=8,
+            text_color="#ffffff", height=18
+        )
+        row.badge.pack(side="left", padx=(4, 6), pady=1)
+        
+        row.notes_label = ctk.CTkLabel(
+            row, text="",
+            font=("Segoe UI", 10),
+            anchor="w"
+        )
+        row.notes_label.pack(side="left", fill="x", expand=True, padx=(0, 4))
+        
+        return row
+    
+    def _hide_summary_rows(self, parent, keep):
+        """Hide the shown summary rows of a section past the first `keep`."""
+        for row in parent.summary_rows[keep:parent.rows_shown]:
+            row.pack_forget()
+        parent.rows_shown = min(parent.rows_shown, keep)
+    
+    def _hide_tag_notes_summary(self, parent):
+        """Hide every summary row and the "(no tags)" label of a section."""
+        self._hide_summary_rows(parent, 0)
+        if parent.empty_shown:
+            parent.empty_label.pack_forget()
+            parent.empty_shown = False
     
     # =========================================================================
     # EDIT SECTION: TAG CARDS
@@ -485,23 +765,26 @@ class NotesSidebar(ctk.CTkFrame):
         item = self._current_item
         
         if item is None:
-            self.edit_target_label.configure(text="Select a cue to edit")
+            self._set(self.edit_target_label, text="Select a cue to edit")
             return
         
         type_str = "Cue" if self._current_item_type == 'marker' else "Vamp"
-        self.edit_target_label.configure(text=f"Editing: {type_str} — {item.name}")
+        self._set(self.edit_target_label, text=f"Editing: {type_str} — {item.name}")
         
-        # Update dropdown to only show tags not yet added
-        existing = set(item.tag_notes.keys())
-        available = [t for t in AVAILABLE_TAGS if t not in existing]
-        self.add_tag_menu.configure(values=available if available else ["(all tags added)"])
-        self.add_tag_var.set("+ Add Tag")
+        self._update_add_tag_menu()
         
         # Build a card for each tag
         for tag, notes in item.tag_notes.items():
             card = self._create_tag_card(tag, notes)
             self._tag_cards.append(card)
     
+    def _update_add_tag_menu(self):
+        """Offer only tags the current item doesn't have yet in the Add Tag dropdown."""
+        existing = self._current_item.tag_notes
+        available = [t for t in AVAILABLE_TAGS if t not in existing]
+        self._set(self.add_tag_menu, values=available if available else ["(all tags added)"])
+        self.add_tag_var.set("+ Add Tag")
+    
     def _create_tag_card(self, tag, notes):
         """
         Create an editable card for a single tag.
@@ -533,45 +816,17 @@ class NotesSidebar(ctk.CTkFrame):
         )
         btn_delete.pack(side="right", padx=2)
         
-        # Edit / Save toggle button
-        btn_edit = ctk.CTkButton(
-            header, text="Edit", width=50, height=22,
-            fg_color=COLOR_BG_LIGHT, hover_color="#555555",
-            text_color=COLOR_TEXT, font=("Segoe UI", 10),
-            command=None  # Set below
-        )
-        btn_edit.pack(side="right", padx=2)
-        
-        # ---- VIEW mode: label showing saved notes ----
-        view_label = ctk.CTkLabel(
-            card, text=notes if notes else "(click Edit to add notes)",
-            font=("Segoe UI", 11),
-            text_color=COLOR_TEXT if notes else COLOR_TEXT_DIM,
-            wraplength=RIGHT_SIDEBAR_WIDTH - 60,
-            justify="left", anchor="w"
-        )
-        view_label.pack(fill="x", padx=PADDING_MEDIUM, pady=(0, PADDING_SMALL))
-        
-        # ---- EDIT mode: textbox container (hidden initially) ----
-        edit_container = ctk.CTkFrame(card, fg_color="transparent")
-        
-        textbox = ctk.CTkTextbox(
-            edit_container, height=70,
-            font=("Segoe UI", 11),
-            fg_color=COLOR_BG_MEDIUM, text_color=COLOR_TEXT,
-            corner_radius=4, wrap="word"
-        )
-        textbox.pack(fill="x", padx=2, pady=(0, 4))
-        textbox.insert("0.0", notes)
-        
         # ---- Toggle logic ----
+        # Defined before the widgets it drives so the Edit button can be
+        # created with its command; it only runs on click, once they exist
         card._editing = False
         
         def toggle_edit():
             if card._editing:
                 # === SAVE ===
-                new_text = textbox.get("0.0", "end").strip()
-                if self._current_item:
+                new_text = textbox.get("1.0", "end-1c").strip()
+                # Only persist real changes; Save straight after Edit is common
+                if self._current_item and self._current_item.tag_notes.get(tag) != new_text:
                     self._current_item.tag_notes[tag] = new_text
                     if self.on_tag_note_save:
                         self.on_tag_note_save(self._current_item.id, tag, new_text)
@@ -589,11 +844,14 @@ class NotesSidebar(ctk.CTkFrame):
                 self._refresh_current(self._current_position)
             else:
                 # === EDIT ===
-                textbox.delete("0.0", "end")
                 current_notes = ""
                 if self._current_item:
                     current_notes = self._current_item.tag_notes.get(tag, "")
-                textbox.insert("0.0", current_notes)
+                # Usually the textbox still holds these notes from the last
+                # edit (or creation); rewriting it would only force a redraw
+                if textbox.get("1.0", "end-1c") != current_notes:
+                    textbox.delete("1.0", "end")
+                    textbox.insert("1.0", current_notes)
                 
                 view_label.pack_forget()
                 edit_container.pack(fill="x", padx=PADDING_SMALL, pady=(0, PADDING_SMALL))
@@ -601,7 +859,36 @@ class NotesSidebar(ctk.CTkFrame):
                 card._editing = True
                 textbox.focus_set()
         
-        btn_edit.configure(command=toggle_edit)
+        # Edit / Save toggle button
+        btn_edit = ctk.CTkButton(
+            header, text="Edit", width=50, height=22,
+            fg_color=COLOR_BG_LIGHT, hover_color="#555555",
+            text_color=COLOR_TEXT, font=("Segoe UI", 10),
+            command=toggle_edit
+        )
+        btn_edit.pack(side="right", padx=2)
+        
+        # ---- VIEW mode: label showing saved notes ----
+        view_label = ctk.CTkLabel(
+            card, text=notes if notes else "(click Edit to add notes)",
+            font=("Segoe UI", 11),
+            text_color=COLOR_TEXT if notes else COLOR_TEXT_DIM,
+            wraplength=RIGHT_SIDEBAR_WIDTH - 60,
+            justify="left", anchor="w"
+        )
+        view_label.pack(fill="x", padx=PADDING_MEDIUM, pady=(0, PADDING_SMALL))
+        
+        # ---- EDIT mode: textbox container (hidden initially) ----
+        edit_container = ctk.CTkFrame(card, fg_color="transparent")
+        
+        textbox = ctk.CTkTextbox(
+            edit_container, height=70,
+            font=("Segoe UI", 11),
+            fg_color=COLOR_BG_MEDIUM, text_color=COLOR_TEXT,
+            corner_radius=4, wrap="word"
+        )
+        textbox.pack(fill="x", padx=2, pady=(0, 4))
+        textbox.insert("0.0", notes)
         
         return card
     
@@ -620,31 +907,6 @@ class NotesSidebar(ctk.CTkFrame):
             self._tag_cards.remove(card_widget)
         
         # Update dropdown and NOW display
-        existing = set(self._current_item.tag_notes.keys())
-        available = [t for t in AVAILABLE_TAGS if t not in existing]
-        self.add_tag_menu.configure(values=available if available else ["(all tags added)"])
-        self.add_tag_var.set("+ Add Tag")
+        self._update_add_tag_menu()
         
         self._refresh_current(self._current_position)
-    
-    # =========================================================================
-    # UTILITIES
-    # =========================================================================
-    
-    def _clear_children(self, frame):
-        for w in frame.winfo_children():
-            w.destroy()
-    
-    def _fmt(self, seconds):
-        minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes}:{secs:05.2f}"
-    
-    def _fmt_countdown(self, seconds):
-        if seconds <= 0:
-            return "NOW"
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}:{secs:02d}"
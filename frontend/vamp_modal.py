@@ -16,7 +16,9 @@ import customtkinter as ctk
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_BG_DARK, COLOR_BG_MEDIUM, COLOR_BG_LIGHT,
@@ -79,6 +81,9 @@ class VampModal(ctk.CTkToplevel):
     - Loop range (IN/OUT points)
     - Advanced timing settings (collapsible)
     - Delete/Save actions
+    
+    The window is built once and reused: closing it withdraws it, and
+    rebind() points it at another loop before it is shown again.
     """
     
     def __init__(
@@ -102,6 +107,7 @@ class VampModal(ctk.CTkToplevel):
         # Make modal
         self.transient(parent)
         self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel_click)
         
         # Store slider references
         self.sliders = {}
@@ -109,13 +115,31 @@ class VampModal(ctk.CTkToplevel):
         
         self._create_widgets()
         self._load_values()
-        
-        # Center on parent
+        self._center_on_parent()
+    
+    def _center_on_parent(self):
+        """Center the modal over the parent window."""
+        parent = self.master
         self.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() // 2) - (520 // 2)
         y = parent.winfo_y() + (parent.winfo_height() // 2) - (680 // 2)
         self.geometry(f"+{x}+{y}")
     
+    def rebind(self, loop):
+        """Point the existing modal at another loop and show it again."""
+        self.loop = loop
+        self.title(f"Vamp Settings: {loop.name}")
+        self._load_values()
+        self.deiconify()
+        self._center_on_parent()
+        self.lift()
+        self.grab_set()
+    
+    def _close(self):
+        """Hide the modal so it can be reused on the next open."""
+        self.grab_release()
+        self.withdraw()
+    
     def _create_widgets(self):
         """Create all modal widgets."""
         # Main container
@@ -483,7 +507,7 @@ class VampModal(ctk.CTkToplevel):
         # Close modal
         if self.on_close:
             self.on_close()
-        self.destroy()
+        self._close()
     
     def _on_delete_click(self):
         """Delete this vamp."""
@@ -493,7 +517,7 @@ class VampModal(ctk.CTkToplevel):
             self.state.delete_selected_loop()
             if self.on_close:
                 self.on_close()
-            self.destroy()
+            self._close()
     
     def _on_cancel_click(self):
         """Cancel and close without saving."""
@@ -502,4 +526,4 @@ class VampModal(ctk.CTkToplevel):
         # cache original values if we want true cancel functionality
         if self.on_close:
             self.on_close()
-        self.destroy()
\ No newline at end of file
+        self._close()
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Virtualized row list for Loop Station.
+
+Windows a CTkScrollableFrame over a long list of fixed-height rows: only
+the rows intersecting the viewport (plus a little overscan) exist as
+widgets, and rows that scroll out are handed back to the owning panel to
+be re-bound to the items scrolling in.
+
+The cue sheet, marker panel and library sidebar supply only how to get a
+row, bind it to an item and release it; scrolling, sizing and placement
+live here.
+"""
+
+import tkinter as tk
+from typing import Callable, Optional
+
+import customtkinter as ctk
+
+
+class VirtualList:
+    """
+    Render pooled rows for the items visible in a CTkScrollableFrame.
+
+    Row i is placed at y = i * row_h + row_pad (unscaled pixels) over a
+    sizer frame whose height is count rows, so the scroll region covers
+    every item without a widget per item and binding or hiding rows never
+    triggers a pack re-layout.
+
+    Usage:
+        rows = VirtualList(scroll_frame, ROW_H, ROW_PAD, acquire, bind, release)
+        rows.reset(len(items))
+    """
+
+    def __init__(
+        self,
+        scroll_frame: ctk.CTkScrollableFrame,
+        row_h: int,
+        row_pad: int,
+        acquire: Callable[[int], tk.Widget],
+        bind: Callable[[tk.Widget, int], None],
+        release: Callable[[tk.Widget], None],
+        key: Optional[Callable[[int], object]] = None,
+        overscan: int = 2,
+        bg: str = "",
+    ):
+        """
+        Args:
+            scroll_frame: The scrollable frame the rows are children of.
+            row_h: Row pitch in unscaled pixels, padding included.
+            row_pad: Gap above each row in unscaled pixels.
+            acquire: Returns an unused row for item index i.
+            bind: Points a row at item index i.
+            release: Takes back a row that was hidden (already place_forget()).
+            key: Optional stable identity for item index i. When given,
+                reset() hands each surviving item its previous row back.
+            overscan: Extra rows rendered above and below the viewport.
+            bg: Sizer background, to match the scrollable frame.
+        """
+        self.scroll_frame = scroll_frame
+        self.row_h = row_h
+        self.row_pad = row_pad
+        self._acquire = acquire
+        self._bind = bind
+        self._release = release
+        self._key = key
+        self.overscan = overscan
+
+        self.rows = {}        # item index -> row currently showing it
+        self._keys = {}       # item index -> key it was bound with
+        self._detached = {}   # key -> row detached by the last reset, awaiting reuse
+        self._count = 0
+        self._window = None   # (first, last) item indices currently rendered
+        self._render_job = None
+
+        self._sizer = tk.Frame(scroll_frame, height=0, bg=bg, bd=0, highlightthickness=0)
+        self._sizer.pack(fill="x")
+        self._sizer_height = 0
+        # The sizer dies with the panel; don't let a queued render outlive it
+        self._sizer.bind("<Destroy>", lambda e: self.cancel())
+
+        # CTkScrollableFrame has no public canvas or scrollbar, so this is
+        # the one place that reaches in. The canvas reports every view
+        # change (scroll or resize) through its yscrollcommand.
+        self._canvas = scroll_frame._parent_canvas
+        self._scrollbar = scroll_frame._scrollbar
+        self._canvas.configure(yscrollcommand=self._on_yscroll)
+
+    def reset(self, count: int, to_top: bool = False):
+        """
+        Show count items, re-rendering the visible window now.
+
+        Rows showing the old items are detached by key (when a key function
+        was given) so the same items get them back, else released.
+        """
+        for idx, row in self.rows.items():
+            if self._key is not None:
+                self._detached[self._keys[idx]] = row
+            else:
+                self._release_row(row)
+        self.rows.clear()
+        self._keys.clear()
+        self._window = None
+        self._count = count
+        if to_top:
+            self._canvas.yview_moveto(0)
+        if not count:
+            self._release_detached()
+            self._set_sizer_height(0)
+            return
+        self.render()
+
+    def schedule_render(self):
+        """Coalesce scroll/resize notifications into one window render."""
+        if self._render_job is None:
+            self._render_job = self._sizer.after_idle(self.render)
+
+    def cancel(self):
+        """Drop a pending window render."""
+        if self._render_job is not None:
+            try:
+                self._sizer.after_cancel(self._render_job)
+            except tk.TclError:
+                pass
+            self._render_job = None
+
+    def render(self):
+        """Bind rows to the items intersecting the visible viewport."""
+        self.cancel()
+        count = self._count
+        if not count:
+            return
+
+        canvas = self._canvas
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.scroll_frame)
+        row_px = self.row_h * scaling
+        self._set_sizer_height(round(count * row_px))
+        top = canvas.canvasy(0)
+        view_h = max(canvas.winfo_height(), canvas.winfo_reqheight())
+        first = max(0, int(top // row_px) - self.overscan)
+        last = min(count, int((top + view_h) // row_px) + 1 + self.overscan)
+
+        if (first, last) == self._window:
+            return
+        self._window = (first, last)
+
+        # Release rows that left the window
+        for idx in [i for i in self.rows if not first <= i < last]:
+            self._keys.pop(idx, None)
+            self._release_row(self.rows.pop(idx))
+
+        # Bind rows for items that entered the window, preferring the row
+        # that showed the same item before the last reset
+        for idx in range(first, last):
+            if idx in self.rows:
+                continue
+            row = None
+            if self._key is not None:
+                key = self._keys[idx] = self._key(idx)
+                row = self._detached.pop(key, None)
+            if row is None:
+                row = self._acquire(idx)
+            self._bind(row, idx)
+            # CTk scales place() offsets itself and takes the row height
+            # from the constructor, so y is in unscaled pixels
+            row.place(x=0, y=idx * self.row_h + self.row_pad, relwidth=1.0)
+            self.rows[idx] = row
+        self._release_detached()
+
+    def _on_yscroll(self, first, last):
+        """Forward the scroll position to the scrollbar and re-window the list."""
+        self._scrollbar.set(first, last)
+        self.schedule_render()
+
+    def _set_sizer_height(self, height):
+        """Resize the scrollable area, skipping the configure when unchanged."""
+        if height != self._sizer_height:
+            self._sizer_height = height
+            self._sizer.configure(height=height)
+
+    def _release_row(self, row):
+        row.place_forget()
+        self._release(row)
+
+    def _release_detached(self):
+        """Return rows whose items vanished or scrolled away to the owner."""
+        for row in self._detached.values():
+            self._release_row(row)
+        self._detached.clear()
@@ -22,7 +22,9 @@ from matplotlib.patches import Rectangle
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import (
     COLOR_WAVEFORM, COLOR_WAVEFORM_BG, COLOR_PLAYHEAD,
@@ -30,7 +30,9 @@ if False:
     import frontend.splash
     import frontend.vamp_settings
     import frontend.vamp_modal
+    import frontend.input_dialog
     import frontend.notes_sidebar
+    import frontend.virtual_list
     import backend.audio_engine
     import backend.state_manager
     import backend.loop_detector
@@ -3,6 +3,6 @@ Utility functions for Loop Station.
 """
 
 from .formatting import format_time, parse_time
-from .tooltip import ToolTip
+from .tooltip import ToolTip, SharedToolTip
 
-__all__ = ['format_time', 'parse_time', 'ToolTip']
+__all__ = ['format_time', 'parse_time', 'ToolTip', 'SharedToolTip']
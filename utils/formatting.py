@@ -2,6 +2,7 @@
 Formatting utilities for Loop Station.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -16,6 +17,15 @@ def format_time(seconds: float, include_ms: bool = True) -> str:
     Returns:
         Formatted string like "1:23.45" or "1:23"
     """
+    # Marker/loop times repeat across every cue sheet rebuild, so results
+    # are interned. Rounding to the displayed precision makes the cache hit.
+    if include_ms:
+        seconds = round(seconds, 2)
+    return _format_time_cached(seconds, include_ms)
+
+
+@lru_cache(maxsize=4096)
+def _format_time_cached(seconds: float, include_ms: bool) -> str:
     if seconds < 0:
         seconds = 0
     
@@ -79,4 +89,18 @@ def format_duration(seconds: float) -> str:
     else:
         minutes = int(seconds // 60)
         secs = seconds % 60
-        return f"{minutes}m {secs:.1f}s"
\ No newline at end of file
+        return f"{minutes}m {secs:.1f}s"
+
+
+@lru_cache(maxsize=1024)
+def format_duration_badge(seconds: float) -> str:
+    """
+    Format a short duration badge for list rows.
+    
+    Args:
+        seconds: Duration in seconds
+        
+    Returns:
+        Formatted string like "(4.2s)"
+    """
+    return f"({seconds:.1f}s)"
@@ -22,6 +22,16 @@ else:
     _TIP_FONT = ("Sans", 10)
 
 
+def _unbind_all(widget, sequence, funcid):
+    """Remove one bind_all handler, keeping any others on the same sequence."""
+    # tkinter's unbind_all() drops every handler for the sequence, so strip
+    # just our line from the "all" script and free the Tcl command.
+    script = widget.tk.call("bind", "all", sequence)
+    kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+    widget.tk.call("bind", "all", sequence, kept)
+    widget.deletecommand(funcid)
+
+
 class ToolTip:
     """
     Lightweight tooltip that appears on hover after a short delay.
@@ -169,3 +179,198 @@ class ToolTip:
             self._tip_window = None
         if ToolTip._active_tip is self:
             ToolTip._active_tip = None
+
+
+class SharedToolTip:
+    """
+    One tooltip window shared by many widgets inside a container.
+
+    Per-widget ToolTips bind <Enter>/<Leave>/<ButtonPress> on every widget.
+    For dense, recycled lists (the cue sheet rows) this instead keeps a
+    registry of texts and tracks the pointer with a few app-wide bindings
+    that are only installed while the pointer is inside the container,
+    reusing a single withdrawn Toplevel for display.
+
+    Usage:
+        tips = SharedToolTip(list_frame)
+        tips.register(row_button, "Delete this cue")
+    """
+
+    def __init__(self, container, delay=400):
+        """
+        Args:
+            container: Widget whose descendants may be registered. Pointer
+                tracking starts when the pointer enters it and stops once
+                the pointer is elsewhere or it is destroyed.
+            delay: Milliseconds before the tooltip appears (default 400ms).
+        """
+        self.container = container
+        self.delay = delay
+        self._texts = {}        # widget path -> tooltip text
+        self._target = None     # registered widget currently under the pointer
+        self._after_id = None
+        self._tip_window = None
+        self._label = None
+        self._visible = False
+        self._bound = {}        # sequence -> funcid of our app-wide handler
+
+        # tk.Misc.bind: CTk widgets forward bind() to inner canvases
+        tk.Misc.bind(container, "<Enter>", self._install, add="+")
+        tk.Misc.bind(container, "<Destroy>", self._on_destroy, add="+")
+
+    def register(self, widget, text):
+        """Show text when the pointer rests on widget (or any of its children)."""
+        self._texts[str(widget)] = text
+
+    def update_text(self, widget, text):
+        """Change a registered widget's tooltip text."""
+        self.register(widget, text)
+        if self._visible and self._target is widget:
+            self._label.configure(text=text)
+
+    def _install(self, event=None):
+        if self._bound:
+            return
+        for sequence, handler in (("<Motion>", self._on_pointer),
+                                  ("<Leave>", self._on_pointer),
+                                  ("<ButtonPress>", self._on_press)):
+            self._bound[sequence] = self.container.bind_all(
+                sequence, handler, add="+")
+
+    def _uninstall(self, bound=None):
+        if bound is None:
+            bound, self._bound = self._bound, {}
+        for sequence, funcid in bound.items():
+            try:
+                _unbind_all(self.container, sequence, funcid)
+            except tk.TclError:
+                pass
+
+    def _on_destroy(self, event):
+        if event.widget is self.container:
+            self._cancel()
+            self._uninstall()
+
+    def _locate(self, widget):
+        # CTk widgets are made of inner canvases/labels, so walk up to the
+        # registered widget. Returns (inside container, registered ancestor).
+        target = None
+        while widget is not None:
+            if widget is self.container:
+                return True, target
+            if target is None and str(widget) in self._texts:
+                target = widget
+            widget = widget.master
+        return False, None
+
+    def _on_pointer(self, event):
+        try:
+            inside, target = self._locate(
+                self.container.winfo_containing(event.x_root, event.y_root)
+            )
+        except (KeyError, tk.TclError):
+            inside, target = False, None  # Non-Python or destroyed widget
+
+        if not inside and self._bound:
+            # Pointer left the container: drop the app-wide handlers until
+            # the next <Enter>. Deferred so we don't free the running callback.
+            bound, self._bound = self._bound, {}
+            self.container.after_idle(self._uninstall, bound)
+
+        if target is self._target:
+            return
+        self._cancel()
+        self._hide()
+        self._target = target
+        if target is not None:
+            self._after_id = self.container.after(self.delay, self._show)
+
+    def _on_press(self, event=None):
+        # Hide on click, like ToolTip; re-arm once the pointer moves elsewhere
+        self._cancel()
+        self._hide()
+
+    def _cancel(self):
+        if self._after_id:
+            try:
+                self.container.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _ensure_window(self):
+        if self._tip_window is not None:
+            return
+        tw = tk.Toplevel(self.container)
+        tw.withdraw()
+        tw.wm_overrideredirect(True)  # No window decorations
+        try:
+            tw.wm_attributes("-topmost", True)
+        except tk.TclError:
+            pass
+
+        # Style the tooltip (same look as ToolTip)
+        frame = tk.Frame(
+            tw, background="#2a2a3a", borderwidth=1, relief="solid",
+            highlightbackground="#555566", highlightthickness=1
+        )
+        frame.pack()
+        self._label = tk.Label(
+            frame,
+            background="#2a2a3a",
+            foreground="#e0e0e0",
+            font=_TIP_FONT,
+            padx=8,
+            pady=4,
+            justify="left",
+            wraplength=300,
+        )
+        self._label.pack()
+        self._tip_window = tw
+
+    def _show(self):
+        self._after_id = None
+        widget = self._target
+        if widget is None:
+            return
+        try:
+            if not widget.winfo_exists():
+                return
+            self._ensure_window()
+
+            # Dismiss any per-widget tooltip that is showing
+            if ToolTip._active_tip:
+                ToolTip._active_tip._hide()
+
+            self._label.configure(text=self._texts.get(str(widget), ""))
+
+            # Position: below the widget, slightly right
+            tw = self._tip_window
+            tw.update_idletasks()
+            x = widget.winfo_rootx() + 12
+            y = widget.winfo_rooty() + widget.winfo_height() + 4
+            tip_w = tw.winfo_reqwidth()
+            tip_h = tw.winfo_reqheight()
+            screen_w = widget.winfo_screenwidth()
+            screen_h = widget.winfo_screenheight()
+
+            if x + tip_w > screen_w - 10:
+                x = screen_w - tip_w - 10
+            if y + tip_h > screen_h - 10:
+                # Show above the widget instead
+                y = widget.winfo_rooty() - tip_h - 4
+
+            tw.wm_geometry(f"+{x}+{y}")
+            tw.deiconify()
+            tw.lift()
+            self._visible = True
+        except tk.TclError:
+            pass  # Widget destroyed during positioning
+
+    def _hide(self):
+        if self._visible:
+            try:
+                self._tip_window.withdraw()
+            except tk.TclError:
+                pass
+            self._visible = False